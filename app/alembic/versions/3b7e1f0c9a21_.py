@@ -0,0 +1,32 @@
+"""add post (board_id, create_date, id) index
+
+Revision ID: 3b7e1f0c9a21
+Revises: 18dfdfa02a49
+Create Date: 2026-10-18 10:12:41.118302
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7e1f0c9a21"
+down_revision: Union[str, None] = "18dfdfa02a49"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_post_board_id_create_date_id",
+        "post",
+        ["board_id", sa.text("create_date DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_post_board_id_create_date_id", table_name="post")
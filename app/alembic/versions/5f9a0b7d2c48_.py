@@ -0,0 +1,46 @@
+"""add post search_vector column with GIN index
+
+Revision ID: 5f9a0b7d2c48
+Revises: 8c2d4e6f1b35
+Create Date: 2026-10-18 14:26:03.402871
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5f9a0b7d2c48"
+down_revision: Union[str, None] = "8c2d4e6f1b35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "post",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('simple', title || ' ' || content)", persisted=True
+            ),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_post_search_vector",
+        "post",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_post_search_vector", table_name="post")
+    op.drop_column("post", "search_vector")
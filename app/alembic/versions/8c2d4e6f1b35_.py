@@ -0,0 +1,46 @@
+"""add board list partial indexes
+
+Revision ID: 8c2d4e6f1b35
+Revises: 3b7e1f0c9a21
+Create Date: 2026-10-18 11:02:17.530914
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8c2d4e6f1b35"
+down_revision: Union[str, None] = "3b7e1f0c9a21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_board_public_rank",
+        "board",
+        [sa.text("count DESC"), sa.text("update_date DESC"), sa.text("id DESC")],
+        unique=False,
+        postgresql_where=sa.text("public = true"),
+    )
+    op.create_index(
+        "ix_board_private_user_id_rank",
+        "board",
+        [
+            "user_id",
+            sa.text("count DESC"),
+            sa.text("update_date DESC"),
+            sa.text("id DESC"),
+        ],
+        unique=False,
+        postgresql_where=sa.text("public = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_board_private_user_id_rank", table_name="board")
+    op.drop_index("ix_board_public_rank", table_name="board")
@@ -0,0 +1,30 @@
+"""add board deleted flag for background purge
+
+Revision ID: a7e3c1d9f024
+Revises: 5f9a0b7d2c48
+Create Date: 2026-10-18 18:42:11.207315
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7e3c1d9f024"
+down_revision: Union[str, None] = "5f9a0b7d2c48"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "board",
+        sa.Column("deleted", sa.Boolean(), server_default=sa.false(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("board", "deleted")
@@ -1,17 +1,49 @@
+from contextlib import asynccontextmanager
 from typing import Annotated
 
-from sqlalchemy.orm import Session
-from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Depends, Request
 
-from app.core.db import SessionLocal
+from app.core import query_budget
+from app.core.config import settings
+from app.core.db import SessionLocal, PRIMARY_STICKY_COOKIE, read_session
 
+READ_ONLY_METHODS = ("GET", "HEAD")
 
-def get_db():  # 데이터베이스 세션 관리
-    db = SessionLocal()
-    try:
-        yield db  # 세션 생성
-    finally:
-        db.close()  # 세션 종료
 
+def new_session(request: Request) -> AsyncSession:
+    """
+    읽기 요청(GET, HEAD)은 replica, 쓰기 요청은 primary 데이터베이스 세션 생성
+    - 최근에 쓰기 요청을 한 클라이언트는 방금 쓴 내용을 읽을 수 있도록 primary 사용
+    """
+    if (
+        request.method in READ_ONLY_METHODS
+        and PRIMARY_STICKY_COOKIE not in request.cookies
+    ):
+        return read_session()
+    return SessionLocal()
 
-DatabaseDep = Annotated[Session, Depends(get_db)]
+
+@asynccontextmanager
+async def request_session(request: Request):
+    """
+    요청에 맞는 데이터베이스 세션 (new_session 참고), 블록이 끝나면 세션 종료
+    - QUERY_DEBUG 모드에서는 블록 안에서 실행된 쿼리 수 / 반복 쿼리(N+1) 추적
+    """
+    async with new_session(request) as db:
+        if not settings.QUERY_DEBUG:
+            yield db
+            return
+
+        route = request.scope.get("route")
+        path = route.path if route else request.url.path
+        with query_budget.track(method=request.method, path=path):
+            yield db
+
+
+async def get_db(request: Request):  # 데이터베이스 세션 관리
+    async with request_session(request) as db:
+        yield db
+
+
+DatabaseDep = Annotated[AsyncSession, Depends(get_db)]
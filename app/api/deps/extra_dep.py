@@ -1,11 +1,13 @@
-from typing import Annotated
+from typing import Annotated, NamedTuple
 
 from fastapi import Depends, HTTPException, Path
 from starlette import status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud import board_crud, post_crud
 from app.models import Board, Post
+from app.schemas.board_schema import BoardPublic
+from app.schemas.post_schema import PostPublic, PostListItem
 from app.api.deps.db_dep import DatabaseDep
 
 # 게시판 ID 타입 : path parameter 용도
@@ -14,11 +16,11 @@ board_id = Annotated[int, Path(default=..., description="게시판 ID")]
 post_id = Annotated[int, Path(default=..., description="게시글 ID")]
 
 
-def get_target_board(db_session: DatabaseDep, board_id: board_id) -> Board:
+async def get_target_board(db_session: DatabaseDep, board_id: board_id) -> Board:
     """
     수정, 삭제, 읽기의 타겟인 게시판 가져오기
     """
-    board = board_crud.get_board_by_id(db_session=db_session, id=board_id)
+    board = await board_crud.get_board_by_id(db_session=db_session, id=board_id)
     if not board:  # 존재하지 않는 ID인 경우
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -28,29 +30,52 @@ def get_target_board(db_session: DatabaseDep, board_id: board_id) -> Board:
     return board
 
 
-def get_target_post(db_session: DatabaseDep, post_id: post_id) -> Post:
+class BoardPost(NamedTuple):
+    board: Board
+    post: Post
+
+
+async def get_target_board_post(
+    db_session: DatabaseDep, board_id: board_id, post_id: post_id
+) -> BoardPost:
     """
-    수정, 삭제, 읽기의 타겟인 게시글 가져오기
+    수정, 삭제, 읽기의 타겟인 게시글과 게시글이 속한 게시판 가져오기
+    - 게시판 + 게시글 + 게시글을 쓴 유저를 한 번의 쿼리로 읽음
     """
-    post = post_crud.get_post_by_id(db_session=db_session, id=post_id)
-    if not post:  # 존재하지 않는 ID인 경우
+    result = await post_crud.get_post_with_board(
+        db_session=db_session, board_id=board_id, post_id=post_id
+    )
+    if not result:  # 존재하지 않는 게시판 ID인 경우
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="존재하지 않는 게시판입니다.",
+        )
+
+    board, post = result
+    if not post:  # 존재하지 않는 게시글 ID인 경우
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="존재하지 않는 게시글입니다.",
         )
+    check_relation(board=board, post=post)
 
-    return post
+    return BoardPost(board=board, post=post)
 
 
 TargetBoard = Annotated[Board, Depends(get_target_board)]
-TargetPost = Annotated[Post, Depends(get_target_post)]
+TargetBoardPost = Annotated[BoardPost, Depends(get_target_board_post)]
 
 
-def check_unique_name(db_session: Session, name: str) -> None:
+async def check_unique_name(db_session: AsyncSession, name: str) -> None:
     """
     게시판 이름 중복 체크
     """
-    board = board_crud.get_board_by_name(db_session=db_session, name=name)
+    board = await board_crud.get_board_by_name(db_session=db_session, name=name)
+    if board and board.deleted:  # 삭제 표시된 게시판은 정리가 끝날 때까지 이름 유지
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="삭제 중인 게시판의 이름입니다. 잠시 후 다시 시도해주세요.",
+        )
     if board:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -82,5 +107,25 @@ def check_relation(board: Board, post: Post) -> None:
         )
 
 
-def add_user_info(target: Board | Post) -> dict:
-    return {**target.__dict__, "user_info": target.user}
+async def to_public(target: Board | Post) -> BoardPublic | PostPublic:
+    """
+    게시판(or 게시글) ORM 객체를 생성한 유저 정보가 포함된 응답 스키마로 변환
+    - 유저 정보가 아직 로딩되지 않은 경우에만 조회 쿼리 발생
+    - dict 복사 없이 ORM 속성에서 바로 검증 (user -> user_info)
+    """
+    await target.awaitable_attrs.user
+    schema = BoardPublic if isinstance(target, Board) else PostPublic
+    return schema.model_validate(target)
+
+
+def to_list_item(post: Post, fields: list[str], excerpt: bool) -> PostListItem:
+    """
+    게시글 ORM 객체를 목록용 스키마로 변환
+    - 요청한 항목만 읽으므로 로딩하지 않은 컬럼(본문 등)에 접근하지 않음
+    """
+    values = {"id": post.id}
+    for field in fields:
+        values[field] = post.user if field == "user_info" else getattr(post, field)
+    if excerpt:
+        values["excerpt"] = post.excerpt
+    return PostListItem.model_validate(values)
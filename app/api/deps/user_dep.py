@@ -5,19 +5,21 @@ from fastapi.security import OAuth2PasswordRequestForm
 from starlette import status
 
 from app.core import security
+from app.core.session_cache import session_cache
 from app.crud import user_crud
-from app.models import User
+from app.schemas.user_schema import UserPublic
 from app.api.deps.db_dep import DatabaseDep
 
 PasswordFormDep = Annotated[OAuth2PasswordRequestForm, Depends()]
 
 
-def get_current_user(
+async def get_current_user(
     db_session: DatabaseDep, session_id: Annotated[str | None, Cookie()] = None
-) -> User:
+) -> UserPublic:
     """
     로그인 상태에서만 사용할 수 있는 API에 사용 (Create, Update, Delete ..)
     - 현재 로그인 중인 유저 정보를 리턴 (리턴하지 못하면 에러 발생)
+    - 세션 캐시에 있으면 redis, db 조회 없이 바로 리턴
     """
     if not session_id:  # 쿠키에 세션 id X
         raise HTTPException(
@@ -25,38 +27,51 @@ def get_current_user(
             detail="현재 로그인 상태가 아닙니다.",
         )
 
-    user_id = security.get_session(session_id=session_id)
+    user = session_cache.get(session_id)
+    if user:
+        return user
+
+    user_id = await security.get_session(session_id=session_id)
     if not user_id:  # redis에 세션 id X
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="유효하지 않거나 이미 만료된 세션입니다.",
         )
 
-    user = user_crud.get_user_by_id(db_session=db_session, id=user_id)
-    if not user:  # db에 유저 id X (탈퇴한 유저의 경우?(아직 api 없음))
+    db_user = await user_crud.get_user_by_id(db_session=db_session, id=user_id)
+    if not db_user:  # db에 유저 id X (탈퇴한 유저의 경우?(아직 api 없음))
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="존재하지 않는 유저의 세션입니다.",
         )
 
+    user = UserPublic.model_validate(db_user)
+    session_cache.set(session_id, user)
+
     return user
 
 
-def get_curret_user_optional(
+async def get_curret_user_optional(
     db_session: DatabaseDep, session_id: Annotated[str | None, Cookie()] = None
-) -> User | None:
+) -> UserPublic | None:
     """
     로그인 하지 않은 상태에서도 사용할 수 있는 API에 사용 (Get)
     - 유저 정보 리턴할 수 있으면 하고, 안되면 None 리턴
     """
     if session_id:
-        user_id = security.get_session(session_id=session_id)
+        user = session_cache.get(session_id)
+        if user:
+            return user
+
+        user_id = await security.get_session(session_id=session_id)
         if user_id:
-            user = user_crud.get_user_by_id(db_session=db_session, id=user_id)
-            if user:
+            db_user = await user_crud.get_user_by_id(db_session=db_session, id=user_id)
+            if db_user:
+                user = UserPublic.model_validate(db_user)
+                session_cache.set(session_id, user)
                 return user
     return None
 
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
-CurrentUserOptional = Annotated[User | None, Depends(get_curret_user_optional)]
+CurrentUser = Annotated[UserPublic, Depends(get_current_user)]
+CurrentUserOptional = Annotated[UserPublic | None, Depends(get_curret_user_optional)]
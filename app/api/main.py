@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
-from app.api.routes import users, login, boards, posts
+from app.api.routes import users, login, boards, posts, search, status, metrics
+from app.core.config import settings
 
 api_router = APIRouter()
 
@@ -10,3 +11,7 @@ api_router.include_router(boards.router, prefix="/boards", tags=["게시판"])
 api_router.include_router(
     posts.router, prefix="/boards/{board_id}/posts", tags=["게시글"]
 )
+api_router.include_router(search.router, prefix="/search", tags=["검색"])
+api_router.include_router(status.router, prefix="/status", tags=["상태"])
+if settings.METRICS_ENABLED:
+    api_router.include_router(metrics.router, tags=["상태"])
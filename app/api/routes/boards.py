@@ -1,6 +1,8 @@
-from typing import Any, Annotated
+from typing import Any, Annotated, Literal
+from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Header, Response
+from fastapi.responses import ORJSONResponse
 from starlette import status
 
 from app.schemas import board_schema, common_schema
@@ -10,9 +12,14 @@ from app.api.deps.extra_dep import (
     TargetBoard,
     check_unique_name,
     check_access_right,
-    add_user_info,
+    to_public,
 )
 from app.crud import board_crud
+from app.core import cache
+from app.core.config import settings
+from app.utils.cursor import encode_cursor, decode_cursor
+from app.utils.etag import make_etag, etag_matches, cache_headers
+from app.utils.response import model_response
 
 router = APIRouter()
 
@@ -24,18 +31,20 @@ router = APIRouter()
     summary="게시판 생성",
     description="새로운 게시판 생성",
 )
-def create_board(
+async def create_board(
     db_session: DatabaseDep,
     current_user: CurrentUser,
     board_info: board_schema.BoardCreate,
 ) -> Any:
-    check_unique_name(db_session=db_session, name=board_info.name)
+    await check_unique_name(db_session=db_session, name=board_info.name)
 
-    new_board = board_crud.create_board(
+    new_board = await board_crud.create_board(
         db_session=db_session, board_create=board_info, user_id=current_user.id
     )
 
-    return add_user_info(target=new_board)
+    return model_response(
+        await to_public(target=new_board), status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.patch(
@@ -45,7 +54,7 @@ def create_board(
     summary="게시판 수정",
     description="내가 생성한 게시판 수정하기",
 )
-def update_board(
+async def update_board(
     db_session: DatabaseDep,
     current_user: CurrentUser,
     board_info: board_schema.BoardUpdate,
@@ -57,13 +66,15 @@ def update_board(
     if (
         board_info.name and board_info.name != board.name
     ):  # 수정하려는 게시판은 중복 체크 제외
-        check_unique_name(db_session=db_session, name=board_info.name)
+        await check_unique_name(db_session=db_session, name=board_info.name)
 
-    updated_board = board_crud.update_board(
+    updated_board = await board_crud.update_board(
         db_session=db_session, board=board, board_update=board_info
     )
 
-    return add_user_info(target=updated_board)
+    return model_response(
+        await to_public(target=updated_board), status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.delete(
@@ -72,7 +83,7 @@ def update_board(
     summary="게시판 삭제",
     description="내가 생성한 게시판 삭제",
 )
-def delete_board(
+async def delete_board(
     db_session: DatabaseDep,
     current_user: CurrentUser,
     board: TargetBoard,
@@ -80,7 +91,7 @@ def delete_board(
     check_access_right(req_user_id=current_user.id, target=board)
 
     board_name = board.name
-    board_crud.delete_board(db_session=db_session, board=board)
+    await board_crud.delete_board(db_session=db_session, board=board)
 
     return {"message": f"{board_name} 게시판이 삭제되었습니다."}
 
@@ -89,21 +100,125 @@ def delete_board(
     "",
     response_model=board_schema.BoardList,
     summary="게시판 목록 조회",
-    description="접근 가능한 게시판 목록 조회 (offset pagination)",
+    description="접근 가능한 게시판 목록 조회 (offset pagination 또는 cursor pagination, sort=trending 이면 최근 인기 순서 + offset pagination)",
 )
-def read_board_list(
+async def read_board_list(
     db_session: DatabaseDep,
     current_user: CurrentUserOptional,
     page: Annotated[int, Query(description="현재 페이지 번호", ge=1)] = 1,
     limit: Annotated[int, Query(description="한 페이지당 게시글 수", ge=1)] = 10,
+    cursor: Annotated[
+        str | None,
+        Query(description="이전 페이지 응답의 next_cursor 값 (입력 시 page 무시)"),
+    ] = None,
+    sort: Annotated[
+        Literal["count", "trending"],
+        Query(
+            description="정렬 기준 (count : 게시글 많은 순, trending : 최근 게시글 기반 인기 순)"
+        ),
+    ] = "count",
 ) -> Any:
     current_user_id = current_user.id if current_user else None
-    offset = limit * (page - 1)
 
-    boards = board_crud.get_boards(
-        db_session=db_session, user_id=current_user_id, offset=offset, limit=limit
+    if sort == "trending":  # 인기 순위는 redis에서 바로 읽으므로 캐시 X
+        if cursor:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="trending 정렬은 cursor pagination을 지원하지 않습니다.",
+            )
+        boards = await board_crud.get_trending_boards(
+            db_session=db_session,
+            user_id=current_user_id,
+            limit=limit,
+            offset=limit * (page - 1),
+        )
+        if not boards:
+            if page == 1:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="접근 가능한 게시판들이 존재하지 않습니다.",
+                )
+            else:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="페이지의 끝입니다.",
+                )
+
+        board_list = board_schema.BoardList(
+            page=page,
+            limit=limit,
+            board_list=[await to_public(target=board) for board in boards],
+            total=None,  # 인기 순위에는 볼 수 없는 private 게시판도 있으므로 알려주지 않음
+            total_is_exact=False,
+        )
+        return model_response(board_list)
+
+    if cursor:  # cursor pagination
+        try:
+            cursor_value = decode_cursor(cursor, int, datetime, int)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        page, offset = None, 0
+    else:  # offset pagination
+        cursor_value = None
+        offset = limit * (page - 1)
+
+    # 조회 범위(비로그인 public / 유저별) 단위로 캐시
+    scope = f"user:{current_user_id}" if current_user_id else "public"
+    version_keys = cache.board_list_version_keys(current_user_id)
+
+    async def load_board_total() -> dict:
+        total, total_is_exact = await board_crud.count_boards(
+            db_session=db_session, user_id=current_user_id
+        )
+        return {"total": total, "total_is_exact": total_is_exact}
+
+    async def load_board_list() -> dict:
+        boards = await board_crud.get_boards(
+            db_session=db_session,
+            user_id=current_user_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor_value,
+        )
+        boards_with_userinfo = [await to_public(target=board) for board in boards]
+
+        # 마지막 페이지가 아니면 마지막 게시판의 (count, update_date, id)를 다음 cursor로
+        next_cursor = None
+        if len(boards) == limit:
+            last = boards[-1]
+            next_cursor = encode_cursor(last.count, last.update_date, last.id)
+
+        # 전체 게시판 수는 페이지와 상관없으므로 조회 범위별로 따로 캐시
+        board_total = await cache.read_through(
+            key=f"cache:board-list:{scope}:total",
+            version_keys=version_keys,
+            loader=load_board_total,
+            ttl=settings.BOARD_LIST_CACHE_TTL,
+            stale_ttl=settings.BOARD_LIST_CACHE_STALE_TTL,
+        )
+
+        board_list = board_schema.BoardList(
+            page=page,
+            limit=limit,
+            board_list=boards_with_userinfo,
+            next_cursor=next_cursor,
+            total=board_total["total"],
+            total_is_exact=board_total["total_is_exact"],
+        )
+        return board_list.model_dump(mode="json")
+
+    # 목록은 조회 범위 + 페이지 + limit 단위로 캐시
+    position = f"cursor:{cursor}" if cursor else f"page:{page}"
+    board_list = await cache.read_through(
+        key=f"cache:board-list:{scope}:{position}:{limit}",
+        version_keys=version_keys,
+        loader=load_board_list,
+        ttl=settings.BOARD_LIST_CACHE_TTL,
+        stale_ttl=settings.BOARD_LIST_CACHE_STALE_TTL,
     )
-    if not boards:
+
+    if not board_list["board_list"]:
         if page == 1:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -115,20 +230,20 @@ def read_board_list(
                 detail="페이지의 끝입니다.",
             )
 
-    boards_with_userinfo = [add_user_info(target=board) for board in boards]
-
-    return {"page": page, "limit": limit, "board_list": boards_with_userinfo}
+    # 캐시에는 직렬화된 형태로 저장되어 있으므로 재검증 없이 바로 응답
+    return ORJSONResponse(board_list)
 
 
 @router.get(
     "/{board_id}",
     response_model=board_schema.BoardPublic,
     summary="게시판 조회",
-    description="게시판 조회",
+    description="게시판 조회 (If-None-Match 헤더의 ETag가 최신이면 304)",
 )
-def read_board(
+async def read_board(
     current_user: CurrentUserOptional,
     board: TargetBoard,
+    if_none_match: Annotated[str | None, Header()] = None,
 ) -> Any:
     # 게시판이 private일 때
     if board.public is False:
@@ -141,4 +256,10 @@ def read_board(
         else:  # 로그인 상태인 경우 접근권한 체크
             check_access_right(req_user_id=current_user.id, target=board)
 
-    return add_user_info(target=board)
+    # update_date는 마지막 게시글 시각이므로, 게시판 수정 항목(이름, public 여부)도 ETag에 포함
+    etag = make_etag(board.id, board.update_date, board.name, board.public)
+    headers = cache_headers(etag, board.update_date, public=board.public)
+    if etag_matches(if_none_match, etag):  # 클라이언트가 최신 버전을 가지고 있음
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return model_response(await to_public(target=board), headers=headers)
@@ -20,10 +20,10 @@ router = APIRouter()
     summary="로그인",
     description="로그인하여 세션 생성",
 )
-def login_user(
+async def login_user(
     db_session: DatabaseDep, form_data: PasswordFormDep, response: Response
 ) -> Any:
-    user = user_crud.authenticate(
+    user = await user_crud.authenticate(
         db_session=db_session, email=form_data.username, password=form_data.password
     )
     if not user:
@@ -33,7 +33,7 @@ def login_user(
         )
 
     # redis에 세션 생성
-    session_id = security.create_session(user_id=user.id)
+    session_id = await security.create_session(user_id=user.id)
     # 쿠키에 세션 id 저장
     response.set_cookie(key="session_id", value=session_id, httponly=True)
 
@@ -47,7 +47,7 @@ def login_user(
     summary="로그아웃",
     description="현재 세션 삭제",
 )
-def logout_user(
+async def logout_user(
     response: Response, session_id: Annotated[str | None, Cookie()] = None
 ) -> Any:
     if not session_id:  # 쿠키에 세션 id X
@@ -56,7 +56,7 @@ def logout_user(
             detail="현재 로그인 상태가 아닙니다.",
         )
 
-    user_id = security.get_session(session_id=session_id)
+    user_id = await security.get_session(session_id=session_id)
     if not user_id:  # redis에 세션 id X
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -64,7 +64,7 @@ def logout_user(
         )
 
     # redis에서 세션 삭제
-    security.delete_session(session_id=session_id)
+    await security.delete_session(session_id=session_id)
     # 쿠키에서 세션 id 삭제
     response.delete_cookie(key="session_id", httponly=True)
 
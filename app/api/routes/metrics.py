@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+router = APIRouter()
+
+
+@router.get(
+    "/metrics",
+    include_in_schema=False,
+    summary="메트릭",
+    description="Prometheus 형식 메트릭 (현재 워커 프로세스 기준)",
+)
+async def read_metrics() -> Response:
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
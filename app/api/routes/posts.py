@@ -1,23 +1,32 @@
-from typing import Any, Annotated
+from typing import Any, Annotated, List
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Header, Response, Body, Request
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from starlette import status
 
 from app.schemas import post_schema, common_schema
-from app.api.deps.db_dep import DatabaseDep
+from app.api.deps.db_dep import DatabaseDep, request_session
 from app.api.deps.user_dep import CurrentUser, CurrentUserOptional
 from app.api.deps.extra_dep import (
     TargetBoard,
-    TargetPost,
+    TargetBoardPost,
     check_access_right,
-    check_relation,
-    add_user_info,
+    to_public,
+    to_list_item,
 )
-from app.crud import post_crud, board_crud
+from app.crud import post_crud
+from app.core.config import settings
+from app.utils.cursor import encode_cursor, decode_cursor
+from app.utils.etag import make_etag, etag_matches, cache_headers
+from app.utils.response import model_response, adapter_response
 
 router = APIRouter()
 
+# 게시글 리스트 serializer (일괄 생성 응답용)
+post_list_adapter = TypeAdapter(List[post_schema.PostPublic])
+
 
 @router.post(
     "",
@@ -26,23 +35,50 @@ router = APIRouter()
     summary="게시글 생성",
     description="게시판에 새로운 게시글 생성",
 )
-def create_post(
+async def create_post(
     db_session: DatabaseDep,
     current_user: CurrentUser,
     board: TargetBoard,
     post_info: post_schema.PostCreate,
 ) -> Any:
-    new_post = post_crud.create_post(
+    new_post = await post_crud.create_post(
         db_session=db_session,
         post_create=post_info,
         user_id=current_user.id,
         board_id=board.id,
     )
-    res = add_user_info(target=new_post)
+    return model_response(
+        await to_public(target=new_post), status_code=status.HTTP_201_CREATED
+    )
 
-    board_crud.update_count(db_session=db_session, board=new_post.board, num=1)
 
-    return res
+@router.post(
+    "/batch",
+    response_model=List[post_schema.PostPublic],
+    status_code=status.HTTP_201_CREATED,
+    summary="게시글 일괄 생성",
+    description=f"게시판에 여러 게시글을 한 번에 생성 (최대 {settings.POST_BATCH_MAX_SIZE}개)",
+)
+async def create_posts(
+    db_session: DatabaseDep,
+    current_user: CurrentUser,
+    board: TargetBoard,
+    post_infos: Annotated[
+        List[post_schema.PostCreate],
+        Body(min_length=1, max_length=settings.POST_BATCH_MAX_SIZE),
+    ],
+) -> Any:
+    new_posts = await post_crud.create_posts(
+        db_session=db_session,
+        post_creates=post_infos,
+        user_id=current_user.id,
+        board_id=board.id,
+    )
+    return adapter_response(
+        post_list_adapter,
+        [await to_public(target=post) for post in new_posts],
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.patch(
@@ -52,21 +88,22 @@ def create_post(
     summary="게시글 수정",
     description="내가 쓴 게시글 수정",
 )
-def update_post(
+async def update_post(
     db_session: DatabaseDep,
     current_user: CurrentUser,
-    board: TargetBoard,
-    post: TargetPost,
+    target: TargetBoardPost,
     post_info: post_schema.PostUpdate,
 ) -> Any:
-    check_relation(board=board, post=post)
+    post = target.post
     check_access_right(req_user_id=current_user.id, target=post)
 
-    updated_post = post_crud.update_post(
+    updated_post = await post_crud.update_post(
         db_session=db_session, post=post, post_update=post_info
     )
 
-    return add_user_info(target=updated_post)
+    return model_response(
+        await to_public(target=updated_post), status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.delete(
@@ -75,18 +112,16 @@ def update_post(
     summary="게시글 삭제",
     description="내가 쓴 게시글 삭제",
 )
-def delete_post(
+async def delete_post(
     db_session: DatabaseDep,
     current_user: CurrentUser,
-    board: TargetBoard,
-    post: TargetPost,
+    target: TargetBoardPost,
 ) -> Any:
-    check_relation(board=board, post=post)
+    post = target.post
     check_access_right(req_user_id=current_user.id, target=post)
 
     post_title = post.title
-    board_crud.update_count(db_session=db_session, board=post.board, num=-1)
-    post_crud.delete_post(db_session=db_session, post=post)
+    await post_crud.delete_post(db_session=db_session, post=post)
 
     return {"message": f"{post_title} 게시글이 삭제되었습니다."}
 
@@ -95,16 +130,30 @@ def delete_post(
     "",
     response_model=post_schema.PostList,
     summary="게시글 목록 조회",
-    description="게시판 내 게시글 목록 조회 (cursor pagination)",
+    description="게시판 내 게시글 목록 조회 (cursor pagination, fields로 응답 항목 선택, excerpt로 본문 미리보기)",
 )
-def read_post_list(
+async def read_post_list(
     db_session: DatabaseDep,
     current_user: CurrentUserOptional,
     board: TargetBoard,
     limit: Annotated[int, Query(description="한 페이지당 게시글 수", ge=1)] = 10,
     cursor: Annotated[
-        datetime | None,
-        Query(description="게시글 목록 중 마지막 게시글의 create_date 값"),
+        str | None,
+        Query(description="이전 페이지 응답의 next_cursor 값"),
+    ] = None,
+    fields: Annotated[
+        str | None,
+        Query(
+            description=f"응답에 포함할 게시글 항목 (콤마로 구분, 없으면 전체) : {', '.join(post_schema.POST_LIST_FIELDS)}"
+        ),
+    ] = None,
+    excerpt: Annotated[
+        int | None,
+        Query(
+            description="본문 미리보기 길이 (글자 수)",
+            ge=1,
+            le=settings.POST_EXCERPT_MAX_LENGTH,
+        ),
     ] = None,
 ) -> Any:
     # 게시판이 private일 때
@@ -118,8 +167,33 @@ def read_post_list(
         else:  # 로그인 상태인 경우 접근권한 체크
             check_access_right(req_user_id=current_user.id, target=board)
 
-    posts = post_crud.get_posts_in_board(
-        db_session=db_session, board_id=board.id, limit=limit, cursor=cursor
+    try:
+        cursor_value = decode_cursor(cursor, datetime, int) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if fields:
+        field_list = list(
+            dict.fromkeys(f.strip() for f in fields.split(",") if f.strip())
+        )
+        unknown = [f for f in field_list if f not in post_schema.POST_LIST_FIELDS]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"선택할 수 없는 항목입니다 : {', '.join(unknown)}",
+            )
+    else:  # 선택하지 않으면 전체 항목
+        field_list = list(post_schema.POST_LIST_FIELDS)
+
+    # 요청하지 않은 본문 / 유저 정보는 DB에서 읽지 않음
+    posts = await post_crud.get_posts_in_board(
+        db_session=db_session,
+        board_id=board.id,
+        limit=limit,
+        cursor=cursor_value,
+        with_content="content" in field_list,
+        with_user="user_info" in field_list,
+        excerpt_length=excerpt,
     )
     if not posts:
         if cursor is None:
@@ -133,23 +207,83 @@ def read_post_list(
                 detail="페이지의 끝입니다.",
             )
 
-    posts_with_userinfo = [add_user_info(target=post) for post in posts]
+    post_items = [
+        to_list_item(post=post, fields=field_list, excerpt=excerpt is not None)
+        for post in posts
+    ]
 
-    return {"board_id": board.id, "limit": limit, "post_list": posts_with_userinfo}
+    # 마지막 페이지가 아니면 마지막 게시글의 (create_date, id)를 다음 cursor로
+    next_cursor = None
+    if len(posts) == limit:
+        next_cursor = encode_cursor(posts[-1].create_date, posts[-1].id)
+
+    post_list = post_schema.PostList(
+        board_id=board.id,
+        limit=limit,
+        post_list=post_items,
+        next_cursor=next_cursor,
+        # 게시판에 유지되는 게시글 count 사용 (coalesce 모드면 아직 반영 안 된 증감분이 있을 수 있음)
+        total=board.count,
+        total_is_exact=not settings.BOARD_COUNT_COALESCE,
+    )
+    return model_response(post_list, exclude_unset=True)  # 선택하지 않은 항목 제외
+
+
+# "/{post_id}" 보다 먼저 선언 (export가 post_id로 매칭되지 않도록)
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="게시글 내보내기",
+    description="게시판 내 모든 게시글을 NDJSON(한 줄에 게시글 하나)으로 스트리밍 (오래된 게시글 순서)",
+)
+async def export_posts(
+    request: Request,
+    current_user: CurrentUserOptional,
+    board: TargetBoard,
+) -> Any:
+    # 게시판이 private일 때
+    if board.public is False:
+        # 로그인 상태가 아닌 경우
+        if not current_user:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"해당 '{board.name}' 게시판은 private 상태입니다. 로그인 후 다시 시도해보세요.",
+            )
+        else:  # 로그인 상태인 경우 접근권한 체크
+            check_access_right(req_user_id=current_user.id, target=board)
+
+    async def generate_lines():
+        # 요청의 세션(DatabaseDep)은 응답 전송 전에 닫히므로 전송하는 동안 사용할 세션을 따로 생성
+        async with request_session(request) as db_session:
+            posts = await post_crud.stream_posts_in_board(
+                db_session=db_session,
+                board_id=board.id,
+                chunk_size=settings.POST_EXPORT_CHUNK_SIZE,
+            )
+            async for chunk in posts.partitions():  # chunk 단위로 전송
+                yield b"".join(
+                    [
+                        (await to_public(target=post)).model_dump_json().encode()
+                        + b"\n"
+                        for post in chunk
+                    ]
+                )
+
+    return StreamingResponse(generate_lines(), media_type="application/x-ndjson")
 
 
 @router.get(
     "/{post_id}",
     response_model=post_schema.PostPublic,
     summary="게시글 조회",
-    description="게시글 조회",
+    description="게시글 조회 (If-None-Match 헤더의 ETag가 최신이면 304)",
 )
-def read_post(
+async def read_post(
     current_user: CurrentUserOptional,
-    board: TargetBoard,
-    post: TargetPost,
+    target: TargetBoardPost,
+    if_none_match: Annotated[str | None, Header()] = None,
 ) -> Any:
-    check_relation(board=board, post=post)
+    board, post = target
 
     # 게시판이 private일 때
     if board.public is False:
@@ -162,4 +296,12 @@ def read_post(
         else:  # 로그인 상태인 경우 접근권한 체크
             check_access_right(req_user_id=current_user.id, target=board)
 
-    return add_user_info(target=post)
+    etag = make_etag(post.id, post.update_date)
+    headers = cache_headers(etag, post.update_date, public=board.public)
+    if etag_matches(
+        if_none_match, etag
+    ):  # 클라이언트가 최신 버전을 가지고 있음 (본문 로딩 X)
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    await post.awaitable_attrs.content  # 지연 로딩된 본문 읽기
+    return model_response(await to_public(target=post), headers=headers)
@@ -0,0 +1,103 @@
+from typing import Any, Annotated
+
+from fastapi import APIRouter, HTTPException, Query
+from starlette import status
+
+from app.schemas import post_schema
+from app.api.deps.db_dep import DatabaseDep
+from app.api.deps.user_dep import CurrentUserOptional
+from app.api.deps.extra_dep import check_access_right, to_public
+from app.crud import board_crud, post_crud
+from app.utils.cursor import encode_cursor, decode_cursor
+from app.utils.response import model_response
+
+router = APIRouter()
+
+
+@router.get(
+    "/posts",
+    response_model=post_schema.PostSearchList,
+    summary="게시글 검색",
+    description="게시글 제목 + 본문 검색 (게시판 지정 안하면 접근 가능한 모든 게시판에서 검색, cursor pagination)",
+)
+async def search_posts(
+    db_session: DatabaseDep,
+    current_user: CurrentUserOptional,
+    q: Annotated[str, Query(description="검색어", min_length=1, max_length=100)],
+    board_id: Annotated[
+        int | None, Query(description="검색할 게시판 ID (없으면 전체 게시판)")
+    ] = None,
+    limit: Annotated[int, Query(description="한 페이지당 게시글 수", ge=1)] = 10,
+    cursor: Annotated[
+        str | None,
+        Query(description="이전 페이지 응답의 next_cursor 값"),
+    ] = None,
+) -> Any:
+    current_user_id = current_user.id if current_user else None
+
+    if board_id is not None:
+        board = await board_crud.get_board_by_id(db_session=db_session, id=board_id)
+        if not board:  # 존재하지 않는 ID인 경우
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="존재하지 않는 게시판입니다.",
+            )
+
+        # 게시판이 private일 때
+        if board.public is False:
+            # 로그인 상태가 아닌 경우
+            if not current_user:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail=f"해당 '{board.name}' 게시판은 private 상태입니다. 로그인 후 다시 시도해보세요.",
+                )
+            else:  # 로그인 상태인 경우 접근권한 체크
+                check_access_right(req_user_id=current_user.id, target=board)
+
+    try:
+        cursor_value = decode_cursor(cursor, float, int) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    results = await post_crud.search_posts(
+        db_session=db_session,
+        query=q,
+        user_id=current_user_id,
+        limit=limit,
+        board_id=board_id,
+        cursor=cursor_value,
+    )
+    if not results:
+        if cursor is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="검색 결과가 없습니다.",
+            )
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="페이지의 끝입니다.",
+            )
+
+    # 검증이 끝난 게시글 스키마에 관련도만 붙이기 (재검증 X)
+    posts_with_userinfo = [
+        post_schema.PostSearchResult.model_construct(
+            **dict(await to_public(target=post)), rank=rank
+        )
+        for post, rank in results
+    ]
+
+    # 마지막 페이지가 아니면 마지막 게시글의 (관련도, id)를 다음 cursor로
+    next_cursor = None
+    if len(results) == limit:
+        last_post, last_rank = results[-1]
+        next_cursor = encode_cursor(last_rank, last_post.id)
+
+    search_list = post_schema.PostSearchList(
+        query=q,
+        board_id=board_id,
+        limit=limit,
+        post_list=posts_with_userinfo,
+        next_cursor=next_cursor,
+    )
+    return model_response(search_list)
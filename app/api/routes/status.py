@@ -0,0 +1,18 @@
+from typing import Any
+
+from fastapi import APIRouter
+
+from app.schemas import status_schema
+from app.core import db
+
+router = APIRouter()
+
+
+@router.get(
+    "/db-pool",
+    response_model=status_schema.DBPoolStatus,
+    summary="커넥션 풀 현황",
+    description="현재 워커 프로세스의 데이터베이스 커넥션 풀 현황 조회",
+)
+async def read_db_pool_status() -> Any:
+    return db.pool_status()
@@ -0,0 +1,34 @@
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.core.db import SessionLocal
+from app.crud import board_crud
+
+logger = logging.getLogger(__name__)
+
+
+async def flush_board_count() -> None:
+    """
+    redis에 적립된 게시판 게시글 count 증감분을 주기적으로 DB에 반영 (coalesce 모드)
+    """
+    while True:
+        await asyncio.sleep(settings.BOARD_COUNT_FLUSH_INTERVAL)
+        try:
+            async with SessionLocal() as db_session:
+                await board_crud.flush_count_buffer(db_session=db_session)
+        except Exception:
+            logger.exception("게시판 게시글 count 반영에 실패했습니다.")
+
+
+async def purge_deleted_boards() -> None:
+    """
+    삭제 표시된 게시판의 게시글을 주기적으로 나눠서 삭제한 뒤 게시판 삭제
+    """
+    while True:
+        await asyncio.sleep(settings.BOARD_PURGE_INTERVAL)
+        try:
+            async with SessionLocal() as db_session:
+                await board_crud.purge_deleted_boards(db_session=db_session)
+        except Exception:
+            logger.exception("삭제 표시된 게시판 정리에 실패했습니다.")
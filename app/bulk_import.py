@@ -0,0 +1,395 @@
+"""
+유저 / 게시판 / 게시글 대량 가져오기 (CSV 또는 NDJSON)
+- 파일을 배치 단위로 pydantic 스키마 검증 -> COPY로 임시 테이블에 적재 -> 한 번에 병합
+- 유저는 email, 게시판은 name이 이미 존재하면 기존 것을 사용 (게시글은 항상 추가)
+- 삭제 중인(삭제 표시된) 게시판과 이름이 같은 게시판 + 그 게시판의 게시글은 건너뜀
+- 파일의 id / user_id / board_id 는 가져오는 파일 안에서의 ID (파일을 주지 않은 종류는 DB의 ID)
+- 유저 password 는 passlib 해시 값만 가능 (평문 X)
+
+python -m app.bulk_import --users users.csv --boards boards.ndjson --posts posts.ndjson
+"""
+
+import argparse
+import csv
+import io
+import sys
+import time
+from datetime import datetime
+from typing import Iterator
+
+import orjson
+import redis
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator
+from sqlalchemy import create_engine
+
+from app.core import cache
+from app.core.config import settings
+from app.core.security import pwd_context
+from app.crud import board_crud
+from app.schemas.user_schema import UserCreate
+from app.schemas.board_schema import BoardCreate
+from app.schemas.post_schema import PostCreate
+
+BATCH_SIZE = 10000  # 한 번에 검증 + COPY 하는 row 수
+MAX_REPORTED_ERRORS = 20  # 출력하는 검증 오류 수
+
+
+class UserImport(UserCreate):
+    id: int = Field(default=..., description="파일 안에서의 유저 ID")
+    # 값이 없으면 회원가입과 같이 'Unknown', null은 오류 (DB 컬럼이 NOT NULL)
+    full_name: str = Field(default="Unknown", description="사용자 이름", max_length=30)
+    join_date: datetime | None = Field(default=None, description="가입 시각")
+
+    @field_validator("password")
+    @classmethod
+    def check_password_hash(cls, password: str) -> str:
+        if not pwd_context.identify(password, required=False):
+            raise ValueError("password는 passlib 해시 값이어야 합니다.")
+        return password
+
+
+class BoardImport(BoardCreate):
+    id: int = Field(default=..., description="파일 안에서의 게시판 ID")
+    user_id: int = Field(default=..., description="게시판 생성한 유저 ID")
+    create_date: datetime | None = Field(default=None, description="생성 시각")
+
+
+class PostImport(PostCreate):
+    user_id: int = Field(default=..., description="게시글 생성한 유저 ID")
+    board_id: int = Field(default=..., description="게시글이 속한 게시판 ID")
+    create_date: datetime | None = Field(default=None, description="생성 시각")
+
+
+# 종류별 (스키마, 임시 테이블, 임시 테이블 컬럼 <- 스키마 필드)
+IMPORTS = {
+    "users": (
+        UserImport,
+        "import_user",
+        {
+            "src_id": "id",
+            "email": "email",
+            "full_name": "full_name",
+            "password": "password",
+            "join_date": "join_date",
+        },
+    ),
+    "boards": (
+        BoardImport,
+        "import_board",
+        {
+            "src_id": "id",
+            "name": "name",
+            "public": "public",
+            "user_src_id": "user_id",
+            "create_date": "create_date",
+        },
+    ),
+    "posts": (
+        PostImport,
+        "import_post",
+        {
+            "title": "title",
+            "content": "content",
+            "user_src_id": "user_id",
+            "board_src_id": "board_id",
+            "create_date": "create_date",
+        },
+    ),
+}
+
+STAGING_TABLES = """
+CREATE TEMP TABLE import_user (
+    src_id bigint, email text, full_name text, password text, join_date timestamptz
+) ON COMMIT DROP;
+CREATE TEMP TABLE import_board (
+    src_id bigint, name text, public boolean, user_src_id bigint, create_date timestamptz
+) ON COMMIT DROP;
+CREATE TEMP TABLE import_post (
+    title text, content text, user_src_id bigint, board_src_id bigint, create_date timestamptz
+) ON COMMIT DROP;
+"""
+
+# 파일 안의 ID -> DB의 ID
+# (해당 종류의 파일을 가져오지 않았으면 파일의 ID가 곧 DB의 ID)
+USER_MAP = """
+CREATE TEMP TABLE user_map ON COMMIT DROP AS
+SELECT DISTINCT ON (i.src_id) i.src_id, u.id
+FROM import_user i JOIN "user" u ON u.email = i.email
+ORDER BY i.src_id
+"""
+USER_MAP_EXISTING = """
+CREATE TEMP VIEW user_map AS SELECT id AS src_id, id FROM "user"
+"""
+BOARD_MAP = """
+CREATE TEMP TABLE board_map ON COMMIT DROP AS
+SELECT DISTINCT ON (i.src_id) i.src_id, b.id
+FROM import_board i JOIN board b ON b.name = i.name AND NOT b.deleted
+ORDER BY i.src_id
+"""
+BOARD_MAP_EXISTING = """
+CREATE TEMP VIEW board_map AS SELECT id AS src_id, id FROM board WHERE NOT deleted
+"""
+# 삭제 중인 게시판과 이름이 같아서 건너뛰는 게시판 수
+DELETED_BOARDS = """
+SELECT count(*) FROM import_board i JOIN board b ON b.name = i.name AND b.deleted
+"""
+
+MERGE_USERS = """
+INSERT INTO "user" (email, full_name, password, join_date)
+SELECT DISTINCT ON (email) email, full_name, password, coalesce(join_date, now())
+FROM import_user
+ORDER BY email, src_id
+ON CONFLICT (email) DO NOTHING
+"""
+MERGE_BOARDS = """
+INSERT INTO board (name, public, count, create_date, update_date, user_id)
+SELECT DISTINCT ON (i.name)
+    i.name, i.public, 0, coalesce(i.create_date, now()), coalesce(i.create_date, now()), m.id
+FROM import_board i JOIN user_map m ON m.src_id = i.user_src_id
+ORDER BY i.name, i.src_id
+ON CONFLICT (name) DO NOTHING
+"""
+MERGE_POSTS = """
+INSERT INTO post (title, content, create_date, update_date, user_id, board_id)
+SELECT
+    i.title, i.content, coalesce(i.create_date, now()), coalesce(i.create_date, now()),
+    um.id, bm.id
+FROM import_post i
+JOIN user_map um ON um.src_id = i.user_src_id
+JOIN board_map bm ON bm.src_id = i.board_src_id
+"""
+# 게시글이 추가된 게시판들의 게시글 count를 한 번에 다시 계산 (redis 적립분도 포함됨)
+RECOUNT_BOARDS = """
+UPDATE board SET count = c.count
+FROM (
+    SELECT board_id, count(*) AS count FROM post
+    WHERE board_id IN (SELECT DISTINCT bm.id FROM import_post i JOIN board_map bm ON bm.src_id = i.board_src_id)
+    GROUP BY board_id
+) c
+WHERE board.id = c.board_id
+RETURNING board.id
+"""
+
+
+def read_rows(path: str) -> Iterator[tuple[int, dict]]:
+    """
+    (줄 번호, row) 를 하나씩 읽기 (.csv 는 첫 줄이 헤더, 그 외는 NDJSON)
+    - CSV의 빈 값은 값이 없는 것으로 처리 (스키마 기본값 사용)
+    """
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.endswith(".csv"):
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, {k: v for k, v in row.items() if v != ""}
+        else:
+            for line_num, line in enumerate(f, start=1):
+                if line.strip():
+                    yield line_num, orjson.loads(line)
+
+
+def batched(rows: Iterator, size: int) -> Iterator[list]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def validate_batch(
+    schema: type[BaseModel], adapter: TypeAdapter, batch: list[tuple[int, dict]]
+) -> tuple[list[BaseModel], list[tuple[int, ValidationError]]]:
+    """
+    배치 전체를 한 번에 검증하고, 실패하면 row 하나씩 다시 검증해서 오류 row만 골라냄
+    """
+    try:
+        return adapter.validate_python([row for _, row in batch]), []
+    except ValidationError:
+        pass
+
+    valid, errors = [], []
+    for line_num, row in batch:
+        try:
+            valid.append(schema.model_validate(row))
+        except ValidationError as e:
+            errors.append((line_num, e))
+    return valid, errors
+
+
+def copy_file(cursor, kind: str, path: str, batch_size: int) -> tuple[int, int]:
+    """
+    파일을 검증하여 임시 테이블에 COPY
+    - 리턴 : (적재한 row 수, 오류 row 수)
+    """
+    schema, table, columns = IMPORTS[kind]
+    adapter = TypeAdapter(list[schema])
+    # 값이 없을 수 있는 컬럼(기본값 None)은 빈 값을 NULL로 읽음
+    nullable = [
+        column
+        for column, field in columns.items()
+        if schema.model_fields[field].default is None
+    ]
+    copy_sql = (
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN "
+        f"WITH (FORMAT csv, FORCE_NULL ({', '.join(nullable)}))"
+    )
+
+    loaded = rejected = 0
+    for batch in batched(read_rows(path), batch_size):
+        valid, errors = validate_batch(schema, adapter, batch)
+
+        for line_num, error in errors:
+            if rejected < MAX_REPORTED_ERRORS:
+                print(f"{path}:{line_num} {error}", file=sys.stderr)
+            rejected += 1
+
+        if not valid:
+            continue
+
+        # 문자열은 모두 따옴표로 감싸서 구분자 / 줄바꿈이 들어간 값도 그대로 적재
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC)
+        writer.writerows(
+            [getattr(item, field) for field in columns.values()] for item in valid
+        )
+        buffer.seek(0)
+        cursor.copy_expert(copy_sql, buffer)
+        loaded += len(valid)
+
+    return loaded, rejected
+
+
+def take_buffered_counts(redis_client: redis.Redis, board_ids: list[int]) -> dict:
+    """
+    게시판들의 redis 게시글 count 적립분을 꺼내면서 삭제 (재계산에 이미 포함된 증감분)
+    - 리턴 : {board_id: 증감분} (재계산을 commit 하지 못하면 되돌려 놓기 위함)
+    """
+    if not board_ids:
+        return {}
+    with redis_client.pipeline(transaction=True) as pipe:
+        pipe.hmget(board_crud.COUNT_BUFFER_KEY, board_ids)
+        pipe.hdel(board_crud.COUNT_BUFFER_KEY, *board_ids)
+        nums, _ = pipe.execute()
+    return {
+        board_id: int(num) for board_id, num in zip(board_ids, nums) if num is not None
+    }
+
+
+def bulk_import(args: argparse.Namespace) -> None:
+    files = {kind: getattr(args, kind) for kind in IMPORTS if getattr(args, kind)}
+    if not files:
+        sys.exit("가져올 파일을 하나 이상 지정해주세요. (--users, --boards, --posts)")
+
+    engine = create_engine(settings.db_url_object("postgresql+psycopg2"))
+    redis_client = redis.Redis(host=settings.REDIS_HOST, port=6379, db=0)
+    connection = engine.raw_connection()
+    taken = {}
+    started = time.perf_counter()
+    total_rows = 0
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(STAGING_TABLES)
+
+            # 1. 검증 + 임시 테이블에 적재
+            for kind, path in files.items():
+                stage_started = time.perf_counter()
+                loaded, rejected = copy_file(cursor, kind, path, args.batch_size)
+                elapsed = time.perf_counter() - stage_started
+                total_rows += loaded + rejected
+                print(
+                    f"{kind}: {loaded} rows 적재, {rejected} rows 오류 "
+                    f"({elapsed:.1f}s, {(loaded + rejected) / elapsed:,.0f} rows/s)"
+                )
+
+            # 2. 병합 (유저 -> 게시판 -> 게시글 순서로 ID 매핑)
+            merge_started = time.perf_counter()
+            cursor.execute(MERGE_USERS)
+            print(f"users: {cursor.rowcount} rows 추가 (나머지는 기존 유저 사용)")
+            cursor.execute(USER_MAP if "users" in files else USER_MAP_EXISTING)
+
+            cursor.execute(MERGE_BOARDS)
+            print(
+                f"boards: {cursor.rowcount} rows 추가 (나머지는 기존 게시판 사용 또는 유저 없음)"
+            )
+            if "boards" in files:
+                cursor.execute(DELETED_BOARDS)
+                skipped = cursor.fetchone()[0]
+                if skipped:
+                    print(
+                        f"boards: 삭제 중인 게시판과 이름이 같은 {skipped} rows 건너뜀"
+                    )
+            cursor.execute(BOARD_MAP if "boards" in files else BOARD_MAP_EXISTING)
+
+            cursor.execute(MERGE_POSTS)
+            print(
+                f"posts: {cursor.rowcount} rows 추가 (나머지는 유저 또는 게시판 없음)"
+            )
+
+            # 3. 게시판 게시글 count 재계산
+            # flush_count_buffer와 같은 lock -> commit 전까지 적립분이 DB에 반영되지 않음
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(%s)", (board_crud.COUNT_LOCK_ID,)
+            )
+            cursor.execute(RECOUNT_BOARDS)
+            recounted = [board_id for (board_id,) in cursor.fetchall()]
+            # 재계산된 count에 이미 포함된 적립분 제거 (남겨두면 flush 때 중복 반영됨)
+            taken = take_buffered_counts(redis_client, recounted)
+            print(
+                f"merge: {time.perf_counter() - merge_started:.1f}s "
+                f"(게시판 {len(recounted)}개 count 재계산)"
+            )
+
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        if taken:  # 재계산이 취소되었으므로 꺼낸 적립분을 되돌려 놓음
+            with redis_client.pipeline(transaction=True) as pipe:
+                for board_id, num in taken.items():
+                    pipe.hincrby(board_crud.COUNT_BUFFER_KEY, board_id, num)
+                pipe.execute()
+        raise
+    finally:
+        connection.close()
+
+    redis_client.incr(cache.BOARD_LIST_VERSION_KEY)  # 게시판 목록 캐시 무효화
+    redis_client.close()
+
+    # 통계 갱신 (플래너가 늘어난 row 수를 알도록)
+    with engine.connect() as conn:
+        conn.exec_driver_sql('ANALYZE "user", board, post')
+        conn.commit()
+    engine.dispose()
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"total: {total_rows} rows ({elapsed:.1f}s, {total_rows / elapsed:,.0f} rows/s)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="유저 / 게시판 / 게시글 대량 가져오기 (.csv 또는 NDJSON)"
+    )
+    parser.add_argument(
+        "--users", help="유저 파일 (id, email, full_name, password, join_date)"
+    )
+    parser.add_argument(
+        "--boards", help="게시판 파일 (id, name, public, user_id, create_date)"
+    )
+    parser.add_argument(
+        "--posts", help="게시글 파일 (title, content, user_id, board_id, create_date)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help="한 번에 검증 + COPY 하는 row 수",
+    )
+    bulk_import(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
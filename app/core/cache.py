@@ -0,0 +1,96 @@
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Sequence
+
+import orjson
+
+from app.core.security import redis_client
+
+# 게시판 목록 캐시 버전 (public 게시판 생성/수정/삭제, 게시글 count 변경 시 증가)
+# -> 모든 목록(비로그인 + 유저별)이 public 게시판을 포함하므로 모든 목록 캐시 무효화
+BOARD_LIST_VERSION_KEY = "cache:board-list:version"
+
+LOCK_TIMEOUT = 5  # 캐시 갱신 lock 유지 시간 (초)
+LOCK_WAIT_INTERVAL = 0.05  # 다른 요청이 캐시를 채우기를 기다리는 간격 (초)
+LOCK_WAIT_COUNT = 10  # 기다리는 최대 횟수
+
+# lock을 잡은 요청만 lock을 풀 수 있도록 (값이 자신의 token일 때만 삭제)
+_RELEASE_LOCK_SCRIPT = redis_client.register_script(
+    """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+)
+
+
+def board_list_user_version_key(user_id: int) -> str:
+    """
+    유저별 게시판 목록 캐시 버전 (유저의 private 게시판 변경 시 증가)
+    """
+    return f"{BOARD_LIST_VERSION_KEY}:user:{user_id}"
+
+
+def board_list_version_keys(user_id: int | None) -> list[str]:
+    """
+    게시판 목록 캐시가 따르는 버전들 (비로그인 : public, 로그인 : public + 본인 private)
+    """
+    if user_id is None:
+        return [BOARD_LIST_VERSION_KEY]
+    return [BOARD_LIST_VERSION_KEY, board_list_user_version_key(user_id)]
+
+
+async def bump_version(version_key: str) -> None:
+    """
+    캐시 버전 증가 -> 이전 버전으로 저장된 캐시들은 모두 오래된 값으로 취급
+    """
+    await redis_client.incr(version_key)
+
+
+async def read_through(
+    key: str,
+    version_keys: Sequence[str],
+    loader: Callable[[], Awaitable[Any]],
+    ttl: int,
+    stale_ttl: int,
+) -> Any:
+    """
+    버전 기반 read-through 캐시 (stale-while-revalidate)
+    - 캐시된 값의 버전들이 현재 버전들과 같고 ttl 이내면 그대로 리턴
+    - 오래된 값은 lock을 잡은 요청 하나만 loader로 갱신하고, 나머지 요청은 오래된 값을 리턴
+    - 캐시가 비어 있으면 lock을 잡은 요청이 채울 때까지 잠시 기다림 (DB로 요청이 몰리지 않도록)
+      -> 끝내 lock을 못 잡으면 직접 loader 실행 (다른 요청의 lock은 건드리지 않음)
+    - 값은 JSON으로 직렬화할 수 있어야 하고, ttl + stale_ttl 이 지나면 삭제됨
+    """
+    lock_key = f"{key}:lock"
+    lock_token = None
+
+    for _ in range(LOCK_WAIT_COUNT):
+        *versions, cached = await redis_client.mget(*version_keys, key)
+        versions = [int(version or 0) for version in versions]
+
+        if cached:
+            entry = orjson.loads(cached)
+            if entry["version"] == versions and entry["expire"] > time.time():
+                return entry["data"]  # 최신 값
+
+        token = uuid.uuid4().hex
+        if await redis_client.set(lock_key, token, nx=True, ex=LOCK_TIMEOUT):
+            lock_token = token
+            break  # 갱신 lock 획득 -> 직접 갱신
+        if cached:
+            return entry["data"]  # 다른 요청이 갱신 중 -> 오래된 값 리턴
+
+        await asyncio.sleep(LOCK_WAIT_INTERVAL)  # 다른 요청이 채우기를 기다림
+
+    try:
+        data = await loader()
+        entry = {"version": versions, "expire": time.time() + ttl, "data": data}
+        await redis_client.set(key, orjson.dumps(entry), ex=ttl + stale_ttl)
+    finally:
+        if lock_token:  # 직접 잡은 lock만 해제
+            await _RELEASE_LOCK_SCRIPT(keys=[lock_key], args=[lock_token])
+
+    return data
@@ -1,4 +1,7 @@
+import os
+
 from starlette.config import Config
+from starlette.datastructures import CommaSeparatedStrings
 from sqlalchemy import URL
 
 
@@ -14,12 +17,136 @@ class Settings:
     DB_HOST: str = config("DB_HOST")
     DB_DATABASE: str = config("DB_DATABASE")
 
+    # 데이터베이스 커넥션 풀 (워커 프로세스별)
+    DB_POOL_SIZE: int = config("DB_POOL_SIZE", cast=int, default=5)
+    DB_MAX_OVERFLOW: int = config("DB_MAX_OVERFLOW", cast=int, default=10)
+    DB_POOL_TIMEOUT: float = config(
+        "DB_POOL_TIMEOUT", cast=float, default=30
+    )  # 커넥션을 얻기까지 기다리는 최대 시간 (초)
+    DB_POOL_RECYCLE: int = config(
+        "DB_POOL_RECYCLE", cast=int, default=-1
+    )  # 커넥션 재생성 주기 (초, -1이면 재생성 X)
+    DB_POOL_PRE_PING: bool = config("DB_POOL_PRE_PING", cast=bool, default=False)
+    DB_STATEMENT_TIMEOUT: int = config(
+        "DB_STATEMENT_TIMEOUT", cast=int, default=0
+    )  # 쿼리 최대 실행 시간 (밀리초, 0이면 제한 X)
+
+    # 읽기 전용 replica 데이터베이스 (콤마로 구분한 SQLAlchemy URL 목록, 없으면 primary만 사용)
+    DB_REPLICA_URLS: CommaSeparatedStrings = config(
+        "DB_REPLICA_URLS", cast=CommaSeparatedStrings, default=""
+    )
+    DB_REPLICA_STICKY_SECONDS: int = config(
+        "DB_REPLICA_STICKY_SECONDS", cast=int, default=5
+    )  # 쓰기 요청 후 primary에서만 읽는 시간 (초, replica 복제 지연 대비)
+
     REDIS_HOST: str = config("REDIS_HOST")
     SESSION_EXP: int = 60 * 60 * 24  # 세션 만료 시간 : 1일
 
-    def db_url_object(self):
+    # 게시판 목록 캐시 (redis)
+    BOARD_LIST_CACHE_TTL: int = config(
+        "BOARD_LIST_CACHE_TTL", cast=int, default=30
+    )  # 최신 값으로 취급하는 시간 (초)
+    BOARD_LIST_CACHE_STALE_TTL: int = config(
+        "BOARD_LIST_CACHE_STALE_TTL", cast=int, default=30
+    )  # ttl이 지난 뒤 갱신되는 동안 오래된 값을 대신 응답하는 시간 (초)
+
+    # 인기 게시판 (trending) 점수 반감기 (초) : 이 시간이 지난 게시글의 점수는 절반
+    TRENDING_HALF_LIFE: int = config(
+        "TRENDING_HALF_LIFE", cast=int, default=60 * 60 * 6
+    )
+    TRENDING_SCAN_SIZE: int = config(
+        "TRENDING_SCAN_SIZE", cast=int, default=100
+    )  # 인기 순위에서 한 번에 읽는 게시판 수 (private 게시판 건너뛰기용)
+
+    # 게시판 삭제 : 게시글이 이 개수보다 많으면 숨긴 뒤 백그라운드에서 게시글을 나눠서 삭제
+    BOARD_PURGE_THRESHOLD: int = config("BOARD_PURGE_THRESHOLD", cast=int, default=1000)
+    BOARD_PURGE_CHUNK_SIZE: int = config(
+        "BOARD_PURGE_CHUNK_SIZE", cast=int, default=1000
+    )  # 한 트랜잭션에서 삭제하는 게시글 수
+    BOARD_PURGE_INTERVAL: float = config(
+        "BOARD_PURGE_INTERVAL", cast=float, default=5.0
+    )  # 삭제 표시된 게시판 확인 주기 (초)
+
+    # 게시판 목록 total : public 게시판 추정치가 이 값 이하일 때만 정확히 셈 (초과 시 통계 추정치)
+    BOARD_TOTAL_EXACT_LIMIT: int = config(
+        "BOARD_TOTAL_EXACT_LIMIT", cast=int, default=10000
+    )
+
+    # 게시글 일괄 생성 시 한 번에 생성할 수 있는 최대 게시글 수
+    POST_BATCH_MAX_SIZE: int = config("POST_BATCH_MAX_SIZE", cast=int, default=1000)
+    # 게시글 목록 조회 시 본문 미리보기 최대 길이 (글자 수)
+    POST_EXCERPT_MAX_LENGTH: int = config(
+        "POST_EXCERPT_MAX_LENGTH", cast=int, default=500
+    )
+
+    # 게시글 내보내기(NDJSON) 시 DB에서 한 번에 읽어서 전송하는 게시글 수
+    POST_EXPORT_CHUNK_SIZE: int = config(
+        "POST_EXPORT_CHUNK_SIZE", cast=int, default=1000
+    )
+
+    # 비밀번호 해시 (bcrypt)
+    BCRYPT_ROUNDS: int = config("BCRYPT_ROUNDS", cast=int, default=12)  # cost
+    # uvicorn 워커 프로세스 수 (uvicorn --workers 기본값과 같은 환경 변수)
+    WEB_CONCURRENCY: int = config("WEB_CONCURRENCY", cast=int, default=1)
+    PASSWORD_HASH_WORKERS: int = config(
+        "PASSWORD_HASH_WORKERS",
+        cast=int,
+        default=max((os.cpu_count() or 1) // WEB_CONCURRENCY, 1),
+    )  # 워커 프로세스별 bcrypt 전용 프로세스 수 (기본값 : CPU 수를 워커 수로 나눈 값)
+    PASSWORD_HASH_QUEUE_SIZE: int = config(
+        "PASSWORD_HASH_QUEUE_SIZE", cast=int, default=64
+    )  # 처리 중 + 대기 중인 bcrypt 연산 최대 개수 (초과 시 503)
+    PASSWORD_HASH_RETRY_AFTER: int = config(
+        "PASSWORD_HASH_RETRY_AFTER", cast=int, default=1
+    )  # bcrypt 대기열 초과 503 응답의 Retry-After (초)
+
+    # 워커별 세션 -> 유저 정보 캐시
+    SESSION_CACHE_SIZE: int = config("SESSION_CACHE_SIZE", cast=int, default=10000)
+    SESSION_CACHE_TTL: int = config("SESSION_CACHE_TTL", cast=int, default=60)  # 초
+    SESSION_CACHE_CHANNEL: str = "session-cache:invalidate"  # 무효화 pub/sub 채널
+
+    # 게시판 게시글 count를 redis에 모아서 주기적으로 반영할지 여부 (hot 게시판 row lock 경합 완화)
+    BOARD_COUNT_COALESCE: bool = config(
+        "BOARD_COUNT_COALESCE", cast=bool, default=False
+    )
+    BOARD_COUNT_FLUSH_INTERVAL: float = config(
+        "BOARD_COUNT_FLUSH_INTERVAL", cast=float, default=1.0
+    )  # 초
+
+    # 라우트 그룹별 동시 처리 수 / 대기열 크기 (워커 프로세스별, limit이 0이면 제한 X)
+    AUTH_CONCURRENCY_LIMIT: int = config("AUTH_CONCURRENCY_LIMIT", cast=int, default=8)
+    AUTH_QUEUE_SIZE: int = config("AUTH_QUEUE_SIZE", cast=int, default=32)
+    WRITE_CONCURRENCY_LIMIT: int = config(
+        "WRITE_CONCURRENCY_LIMIT", cast=int, default=10
+    )
+    WRITE_QUEUE_SIZE: int = config("WRITE_QUEUE_SIZE", cast=int, default=50)
+    LIST_READ_CONCURRENCY_LIMIT: int = config(
+        "LIST_READ_CONCURRENCY_LIMIT", cast=int, default=20
+    )
+    LIST_READ_QUEUE_SIZE: int = config("LIST_READ_QUEUE_SIZE", cast=int, default=100)
+    EXPORT_CONCURRENCY_LIMIT: int = config(
+        "EXPORT_CONCURRENCY_LIMIT", cast=int, default=2
+    )
+    EXPORT_QUEUE_SIZE: int = config("EXPORT_QUEUE_SIZE", cast=int, default=4)
+    CONCURRENCY_QUEUE_TIMEOUT: float = config(
+        "CONCURRENCY_QUEUE_TIMEOUT", cast=float, default=5
+    )  # 대기열에서 기다리는 최대 시간 (초, 초과 시 503)
+    CONCURRENCY_RETRY_AFTER: int = config(
+        "CONCURRENCY_RETRY_AFTER", cast=int, default=1
+    )  # 503 응답의 Retry-After (초)
+
+    # /metrics 엔드포인트 + 요청 / SQL / redis / bcrypt 시간 수집 여부
+    METRICS_ENABLED: bool = config("METRICS_ENABLED", cast=bool, default=True)
+
+    # 요청별 쿼리 수 추적 + N+1 감지 (개발 / 테스트용)
+    QUERY_DEBUG: bool = config("QUERY_DEBUG", cast=bool, default=False)
+    QUERY_REPEAT_THRESHOLD: int = config(
+        "QUERY_REPEAT_THRESHOLD", cast=int, default=3
+    )  # 요청 하나에서 같은 쿼리가 이 횟수 이상 실행되면 N+1 경고
+
+    def db_url_object(self, drivername: str = "postgresql+asyncpg"):
         return URL.create(
-            "postgresql+psycopg2",
+            drivername,
             username=self.DB_USER,
             password=self.DB_PASSWORD,
             host=self.DB_HOST,
@@ -1,11 +1,152 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import itertools
+import time
+
+from sqlalchemy import URL, make_url
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
 
 
-engine = create_engine(settings.db_url_object())
+class PoolStats:
+    """
+    커넥션 풀에서 커넥션을 얻기까지 기다린 시간 + 새 커넥션을 맺는 데 걸린 시간 통계
+    """
+
+    def __init__(self):
+        self.wait_count = 0  # 커넥션을 얻은 횟수
+        self.wait_time_total = 0.0  # 기다린 시간 합계 (초)
+        self.wait_time_max = 0.0  # 가장 오래 기다린 시간 (초)
+        self.timeouts = 0  # DB_POOL_TIMEOUT 안에 커넥션을 얻지 못한 횟수
+        self.connect_count = 0  # 새 커넥션을 맺은 횟수
+        self.connect_time_total = 0.0  # 새 커넥션을 맺는 데 걸린 시간 합계 (초)
+        self.connect_time_max = 0.0  # 새 커넥션을 맺는 데 가장 오래 걸린 시간 (초)
+
+    def record(self, wait_time: float, timeout: bool = False) -> None:
+        self.wait_count += 1
+        self.wait_time_total += wait_time
+        self.wait_time_max = max(self.wait_time_max, wait_time)
+        if timeout:
+            self.timeouts += 1
+
+    def record_connect(self, connect_time: float) -> None:
+        self.connect_count += 1
+        self.connect_time_total += connect_time
+        self.connect_time_max = max(self.connect_time_max, connect_time)
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """
+    커넥션을 얻기까지 기다린 시간을 풀별 통계(stats)에 기록하는 커넥션 풀
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats  # 엔진 dispose 후에도 통계 유지
+        return pool
+
+    def _create_connection(self):
+        start = time.perf_counter()
+        record = super()._create_connection()
+        # 연결 시간은 따로 기록하고, _do_get의 대기 시간에서는 제외하도록 표시
+        # (연결 중에 다른 요청이 _do_get을 실행할 수 있으므로 풀이 아닌 커넥션에 표시)
+        record.connect_time = time.perf_counter() - start
+        self.stats.record_connect(record.connect_time)
+        return record
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except TimeoutError:
+            self.stats.record(time.perf_counter() - start, timeout=True)
+            raise
+        connect_time = record.__dict__.pop("connect_time", 0.0)
+        self.stats.record(time.perf_counter() - start - connect_time)
+        return record
+
+
+def engine_options(url: str | URL) -> dict:
+    """
+    create_async_engine에 넘길 커넥션 풀 / 커넥션 옵션
+    - 드라이버별 커넥션 옵션은 해당 드라이버의 URL에만 적용
+    """
+    options = {
+        "poolclass": TimedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if (
+        settings.DB_STATEMENT_TIMEOUT > 0
+        and make_url(url).get_driver_name() == "asyncpg"
+    ):  # 서버 측 쿼리 실행 시간 제한 (asyncpg)
+        options["connect_args"] = {
+            "server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT)}
+        }
+    return options
+
+
+primary_url = settings.db_url_object()
+engine = create_async_engine(primary_url, **engine_options(primary_url))
+replica_engines = [
+    create_async_engine(url, **engine_options(url)) for url in settings.DB_REPLICA_URLS
+]
+_replica_cycle = itertools.cycle(replica_engines)  # replica 라운드 로빈
+
+# 쓰기 요청 직후 primary에서 읽도록 표시하는 쿠키
+PRIMARY_STICKY_COOKIE = "db_primary"
+
+SessionLocal = async_sessionmaker(
+    bind=engine, autoflush=False, expire_on_commit=False
+)  # ? expire_on_commit=False : commit 후 객체 속성에 접근할 때 암묵적인 재조회(IO)가 일어나지 않도록
+
+
+def read_session():
+    """
+    읽기 전용 세션 생성 (replica가 있으면 돌아가면서 사용, 없으면 primary)
+    """
+    if not replica_engines:
+        return SessionLocal()
+    return SessionLocal(bind=next(_replica_cycle))
+
+
+def engine_pool_status(db_engine: AsyncEngine) -> dict:
+    """
+    엔진 하나의 커넥션 풀 현황 (현재 워커 프로세스 기준)
+    """
+    pool = db_engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "wait_count": pool.stats.wait_count,
+        "wait_time_total": pool.stats.wait_time_total,
+        "wait_time_max": pool.stats.wait_time_max,
+        "timeouts": pool.stats.timeouts,
+        "connect_count": pool.stats.connect_count,
+        "connect_time_total": pool.stats.connect_time_total,
+        "connect_time_max": pool.stats.connect_time_max,
+    }
+
 
-SessionLocal = sessionmaker(
-    autocommit=False, autoflush=False, bind=engine
-)  # ? autocommit=False : 데이터 변경 후 commit()을 해야만 데이터베이스에 적용
+def pool_status() -> dict:
+    """
+    커넥션 풀 현황 (primary + replica별)
+    - 읽기 요청은 replica 풀을 사용하므로 replica별 현황도 함께 리턴
+    """
+    return {
+        **engine_pool_status(engine),
+        "replicas": [
+            engine_pool_status(replica_engine) for replica_engine in replica_engines
+        ],
+    }
@@ -0,0 +1,113 @@
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+from prometheus_client import REGISTRY, Counter, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# 짧은 작업(쿼리, redis 호출)용 bucket (초)
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+# bcrypt 연산용 bucket (초, 대기열에서 기다린 시간 포함)
+HASH_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# SQL 종류 (그 외는 OTHER로 묶어서 label 수 제한)
+SQL_OPERATIONS = frozenset(
+    ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "BEGIN", "COMMIT", "ROLLBACK")
+)
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds",
+    "요청 처리 시간",
+    ["method", "route", "status"],
+)
+sql_statement_duration = Histogram(
+    "sql_statement_duration_seconds",
+    "SQL 실행 시간 (count = 실행 횟수)",
+    ["engine", "operation"],
+    buckets=FAST_BUCKETS,
+)
+redis_command_duration = Histogram(
+    "redis_command_duration_seconds",
+    "세션 관련 redis 호출 시간",
+    ["operation"],
+    buckets=FAST_BUCKETS,
+)
+password_hash_duration = Histogram(
+    "password_hash_duration_seconds",
+    "bcrypt 연산 시간 (프로세스 풀 대기 포함)",
+    ["operation"],
+    buckets=HASH_BUCKETS,
+)
+password_hash_rejected = Counter(
+    "password_hash_rejected",
+    "대기열이 가득 차서 거절된 bcrypt 연산 수",
+)
+concurrency_rejected = Counter(
+    "concurrency_rejected",
+    "동시 처리 수 제한으로 거절(503)된 요청 수",
+    ["group"],
+)
+
+
+@contextmanager
+def timer(histogram: Histogram, *labels: str):
+    """
+    with 블록 실행 시간을 histogram에 기록 (예외가 나도 기록)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.labels(*labels).observe(time.perf_counter() - start)
+
+
+def instrument_engine(engine: AsyncEngine, name: str) -> None:
+    """
+    엔진에서 실행되는 모든 SQL의 실행 시간 기록
+    - 시작 시각은 커넥션별 info에 스택으로 저장 (executemany / 중첩 실행 대비)
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        words = statement.lstrip()[:8].split()  # 첫 단어만 필요 (긴 쿼리 전체 복사 X)
+        operation = words[0].upper() if words else "OTHER"
+        if operation not in SQL_OPERATIONS:
+            operation = "OTHER"
+        sql_statement_duration.labels(name, operation).observe(elapsed)
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(context):  # 실패한 쿼리의 시작 시각 정리
+        conn = context.connection
+        if conn is not None and conn.info.get("query_start"):
+            conn.info["query_start"].pop()
+
+
+class StatsCollector(Collector):
+    """
+    dict를 리턴하는 현황 함수(ex. 커넥션 풀, 세션 캐시)를 scrape 시점에 gauge로 변환
+    """
+
+    def __init__(self, prefix: str, stats: Callable[[], dict], documentation: str):
+        self.prefix = prefix
+        self.stats = stats
+        self.documentation = documentation
+
+    def collect(self):
+        for key, value in self.stats().items():
+            yield GaugeMetricFamily(
+                f"{self.prefix}_{key}", self.documentation, value=value
+            )
+
+
+def register_stats(prefix: str, stats: Callable[[], dict], documentation: str) -> None:
+    REGISTRY.register(StatsCollector(prefix, stats, documentation))
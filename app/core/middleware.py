@@ -0,0 +1,193 @@
+import asyncio
+import re
+import time
+
+from fastapi.responses import ORJSONResponse
+from starlette import status
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.db import PRIMARY_STICKY_COOKIE
+from app.core.metrics import http_request_duration, concurrency_rejected
+
+READ_ONLY_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# 동시 처리 수를 제한하는 라우트 그룹
+AUTH_GROUP = "auth"  # 로그인, 회원가입 (bcrypt)
+WRITE_GROUP = "write"  # 생성, 수정, 삭제
+LIST_READ_GROUP = "list_read"  # 게시판 목록, 게시글 목록, 검색
+EXPORT_GROUP = "export"  # 게시글 내보내기 (스트리밍 동안 DB 커넥션 사용)
+
+AUTH_PATHS = ("/login", "/users/signup")
+LIST_READ_PATH = re.compile(r"^/(boards(/\d+/posts)?|search/posts)/?$")
+EXPORT_PATH = re.compile(r"^/boards/\d+/posts/export/?$")
+
+
+class PrimaryStickyMiddleware:
+    """
+    쓰기 요청이 성공하면 일정 시간 동안 primary 데이터베이스에서 읽도록 쿠키 설정
+    - replica 복제 지연 때문에 방금 쓴 내용이 안 보이는 문제(read-your-writes) 방지
+    """
+
+    def __init__(self, app: ASGIApp, max_age: int):
+        self.app = app
+        self.max_age = max_age
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in READ_ONLY_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "set-cookie",
+                    f"{PRIMARY_STICKY_COOKIE}=1; Max-Age={self.max_age}; Path=/; HttpOnly",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+class MetricsMiddleware:
+    """
+    요청 처리 시간을 라우트(path 템플릿) 단위로 기록
+    - 매칭된 라우트가 없는 요청(404 등)은 "unmatched" 로 묶어서 label 수 제한
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500  # 응답 시작 전에 예외가 나면 500
+        start = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # 라우팅 후 scope에 매칭된 라우트가 기록됨
+            route = scope.get("route")
+            http_request_duration.labels(
+                scope["method"],
+                route.path if route else "unmatched",
+                str(status_code),
+            ).observe(time.perf_counter() - start)
+
+
+def route_group(method: str, path: str) -> str | None:
+    """
+    요청이 속한 라우트 그룹 (라우팅 전이므로 method + path로 판단)
+    - 어느 그룹에도 속하지 않는 요청(단건 조회 등)은 제한 X
+    """
+    if method == "POST" and path.rstrip("/") in AUTH_PATHS:
+        return AUTH_GROUP
+    if method not in READ_ONLY_METHODS:
+        return WRITE_GROUP
+    if method == "GET" and EXPORT_PATH.match(path):
+        return EXPORT_GROUP
+    if method == "GET" and LIST_READ_PATH.match(path):
+        return LIST_READ_GROUP
+    return None
+
+
+class ConcurrencyLimiter:
+    """
+    동시에 처리하는 요청 수 + 대기열 크기 제한
+    - 처리 중인 요청이 limit개면 대기열에서 기다림
+    - 대기열이 가득 찼거나 timeout 동안 자리가 나지 않으면 거절 (False)
+    """
+
+    def __init__(self, limit: int, queue_size: int, timeout: float):
+        self.limit = limit
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.active = 0
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def acquire(self) -> bool:
+        if self._semaphore.locked():
+            if self.waiting >= self.queue_size:
+                return False
+            self.waiting += 1
+            try:
+                async with asyncio.timeout(self.timeout):
+                    await self._semaphore.acquire()
+            except TimeoutError:
+                return False
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()  # 바로 획득 (기다리지 않음)
+
+        self.active += 1
+        return True
+
+    def release(self) -> None:
+        self.active -= 1
+        self._semaphore.release()
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "waiting": self.waiting,
+        }
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    라우트 그룹별 동시 처리 수 제한 (load shedding)
+    - 데이터베이스가 느려질 때 요청이 커넥션 풀 대기로 쌓이다가 한꺼번에 timeout 되는 대신,
+      그룹별 대기열이 가득 차면 바로 503 + Retry-After 응답
+    - 쓰기 / 로그인 요청이 몰려도 다른 그룹(목록 조회, 단건 조회)은 영향 X
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiters: dict[str, ConcurrencyLimiter],
+        retry_after: int,
+    ):
+        self.app = app
+        self.limiters = limiters
+        self.retry_after = retry_after
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        group = route_group(scope["method"], scope["path"])
+        limiter = self.limiters.get(group)
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await limiter.acquire():
+            concurrency_rejected.labels(group).inc()
+            response = ORJSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={
+                    "detail": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."
+                },
+                headers={"Retry-After": str(self.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:  # 응답을 모두 보낸 후 (스트리밍 응답 포함) 자리 반환
+            limiter.release()
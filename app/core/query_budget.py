@@ -0,0 +1,145 @@
+import logging
+import os
+import sys
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import greenlet
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CALL_SITE_DEPTH = 3  # 호출 위치로 기록할 app 코드 frame 수 (안쪽부터)
+
+# 엔드포인트별 최대 쿼리 수 (key: (method, path 템플릿))
+_budgets: dict[tuple[str, str], int] = {}
+
+
+class QueryBudgetExceeded(Exception):
+    """
+    요청 하나에서 실행된 쿼리 수가 엔드포인트에 지정된 최대 쿼리 수를 넘은 경우
+    """
+
+
+class QueryTracker:
+    """
+    요청 하나에서 실행된 SQL 기록
+    - 같은 모양(바인딩 파라미터를 제외한 SQL 문자열)의 쿼리가 반복되면 N+1 의심
+    """
+
+    def __init__(self, route: str):
+        self.route = route
+        self.count = 0
+        self.statements: Counter[str] = Counter()
+        self.call_sites: dict[str, set[str]] = defaultdict(set)
+
+    def record(self, statement: str) -> None:
+        self.count += 1
+        self.statements[statement] += 1
+        self.call_sites[statement].add(_call_site())
+
+    def repeated(self) -> list[tuple[str, int]]:
+        return [
+            (statement, count)
+            for statement, count in self.statements.items()
+            if count >= settings.QUERY_REPEAT_THRESHOLD
+        ]
+
+
+_current_tracker: ContextVar[QueryTracker | None] = ContextVar(
+    "query_tracker", default=None
+)
+
+
+def _call_site() -> str:
+    """
+    쿼리를 실행한 app 코드 위치 (ex. "app/api/deps/extra_dep.py:98 to_public <- ...")
+    - async 드라이버는 별도 greenlet에서 쿼리를 실행하므로, 실제 호출 코드는 부모 greenlet의 frame에 있음
+    """
+    frame = sys._getframe(1)
+    parent = greenlet.getcurrent().parent
+    if parent is not None and parent.gr_frame is not None:
+        frame = parent.gr_frame
+
+    sites = []
+    while frame is not None and len(sites) < CALL_SITE_DEPTH:
+        filename = frame.f_code.co_filename
+        if filename.startswith(APP_DIR) and filename != __file__:
+            path = os.path.relpath(filename, os.path.dirname(APP_DIR))
+            sites.append(f"{path}:{frame.f_lineno} {frame.f_code.co_name}")
+        frame = frame.f_back
+    return " <- ".join(sites) or "unknown"
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    추적 중인 요청에서 실행되는 SQL을 기록하도록 엔진에 이벤트 등록
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        tracker = _current_tracker.get()
+        if tracker is not None:
+            tracker.record(statement)
+
+
+def set_budget(method: str, path: str, max_queries: int | None) -> None:
+    """
+    엔드포인트의 최대 쿼리 수 지정 (None이면 해제)
+    - path는 라우트의 path 템플릿 (ex. "/boards/{board_id}/posts")
+    """
+    if max_queries is None:
+        _budgets.pop((method, path), None)
+    else:
+        _budgets[(method, path)] = max_queries
+
+
+@contextmanager
+def budget(method: str, path: str, max_queries: int):
+    """
+    with 블록 안에서만 엔드포인트의 최대 쿼리 수 지정 (테스트용)
+    """
+    previous = _budgets.get((method, path))
+    set_budget(method, path, max_queries)
+    try:
+        yield
+    finally:
+        set_budget(method, path, previous)
+
+
+@contextmanager
+def track(method: str, path: str):
+    """
+    with 블록(요청 하나) 안에서 실행된 SQL 추적
+    - 반복된 쿼리는 라우트 + 호출 위치와 함께 경고 로그
+    - 최대 쿼리 수가 지정된 엔드포인트에서 초과하면 QueryBudgetExceeded 발생
+    """
+    tracker = QueryTracker(route=f"{method} {path}")
+    token = _current_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _current_tracker.reset(token)
+
+    for statement, count in tracker.repeated():
+        logger.warning(
+            "N+1 의심 : %s 에서 같은 쿼리가 %d번 실행되었습니다.\n  호출 위치 : %s\n  %s",
+            tracker.route,
+            count,
+            ", ".join(sorted(tracker.call_sites[statement])),
+            " ".join(statement.split())[:300],
+        )
+    logger.debug("%s : 쿼리 %d개", tracker.route, tracker.count)
+
+    max_queries = _budgets.get((method, path))
+    if max_queries is not None and tracker.count > max_queries:
+        raise QueryBudgetExceeded(
+            f"{tracker.route} 에서 쿼리 {tracker.count}개가 실행되었습니다. (최대 {max_queries}개)"
+        )
@@ -1,49 +1,136 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from uuid import uuid4
 
 from passlib.context import CryptContext
-import redis
+from redis import asyncio as redis
 
 from app.core.config import settings
+from app.core.metrics import (
+    timer,
+    redis_command_duration,
+    password_hash_duration,
+    password_hash_rejected,
+)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# cost(rounds)가 설정값과 다른 해시는 needs_update 대상 -> 로그인 시 재해시
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
 redis_client = redis.Redis(host=settings.REDIS_HOST, port=6379, db=0)
 
+# bcrypt 연산 전용 프로세스 풀 (요청 처리 스레드/이벤트 루프를 막지 않도록)
+_hash_pool: ProcessPoolExecutor | None = None
+_hash_pending = 0  # 프로세스 풀에서 처리 중이거나 대기 중인 연산 수
 
-def get_password_hash(password: str) -> str:
+
+class PasswordHashBusyError(Exception):
     """
-    평문 비밀번호 암호화
+    비밀번호 연산 대기열이 가득 찬 경우
     """
+
+
+def _hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def _verify_and_update(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+async def _run_in_hash_pool(func, *args):
+    """
+    프로세스 풀에서 bcrypt 연산 실행
+    - 대기열(PASSWORD_HASH_QUEUE_SIZE)이 가득 차면 기다리지 않고 바로 PasswordHashBusyError 발생
+    """
+    global _hash_pool, _hash_pending
+
+    if _hash_pending >= settings.PASSWORD_HASH_QUEUE_SIZE:
+        password_hash_rejected.inc()
+        raise PasswordHashBusyError()
+    if _hash_pool is None:
+        _hash_pool = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    _hash_pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        # 연산 종류별 시간 기록 (label : hash, verify_and_update)
+        with timer(password_hash_duration, func.__name__.lstrip("_")):
+            return await loop.run_in_executor(_hash_pool, func, *args)
+    finally:
+        _hash_pending -= 1
+
+
+def shutdown_hash_pool() -> None:
+    """
+    bcrypt 프로세스 풀 종료
+    """
+    global _hash_pool
+
+    if _hash_pool is not None:
+        _hash_pool.shutdown(cancel_futures=True)
+        _hash_pool = None
+
+
+async def get_password_hash(password: str) -> str:
+    """
+    평문 비밀번호 암호화
+    """
+    return await _run_in_hash_pool(_hash, password)
+
+
+async def verify_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
     """
     비밀번호 검증 (평문 비밀번호, 암호화 비밀번호 비교)
+    - (검증 결과, 새 해시) 리턴 : 기존 해시의 cost가 설정값과 다르면 새 해시, 아니면 None
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return await _run_in_hash_pool(_verify_and_update, plain_password, hashed_password)
 
 
-def create_session(user_id: int) -> str:
+async def create_session(user_id: int) -> str:
     """
     세션 생성
     """
     session_id = str(uuid4())
     # key: session_id, value: user_id
-    redis_client.setex(session_id, settings.SESSION_EXP, user_id)
+    with timer(redis_command_duration, "create_session"):
+        await redis_client.setex(session_id, settings.SESSION_EXP, user_id)
 
     return session_id
 
 
-def get_session(session_id: str) -> int | None:
+async def get_session(session_id: str) -> int | None:
     """
     세션 정보 얻기 -> user_id
     """
-    user_id = redis_client.get(session_id)
+    with timer(redis_command_duration, "get_session"):
+        user_id = await redis_client.get(session_id)
     return int(user_id) if user_id else None
 
 
-def delete_session(session_id: str):
+async def delete_session(session_id: str):
     """
     세션 삭제
+    - 요청을 처리한 워커의 세션 캐시에서는 바로 삭제
+    - 다른 워커들의 세션 캐시에서도 삭제되도록 무효화 메시지 발행
     """
-    redis_client.delete(session_id)
+    from app.core.session_cache import session_cache  # 순환 import 방지
+
+    with timer(redis_command_duration, "delete_session"):
+        await redis_client.delete(session_id)
+        session_cache.invalidate_session(session_id)
+        await redis_client.publish(
+            settings.SESSION_CACHE_CHANNEL, f"session:{session_id}"
+        )
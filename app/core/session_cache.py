@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+from app.core.config import settings
+from app.core.security import redis_client
+from app.schemas.user_schema import UserPublic
+
+logger = logging.getLogger(__name__)
+
+
+class SessionCache:
+    """
+    워커(프로세스)별 세션 id -> 유저 정보 캐시 (LRU + TTL)
+    - 다른 워커에서 발생한 변경은 redis pub/sub 메시지로 무효화
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # key: session_id, value: (만료 시각, 유저 정보)
+        self._entries: OrderedDict[str, tuple[float, UserPublic]] = OrderedDict()
+
+    def get(self, session_id: str) -> UserPublic | None:
+        """
+        캐시에서 유저 정보 읽기 (없거나 만료되었으면 None)
+        """
+        entry = self._entries.get(session_id)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                self.invalidate_session(session_id)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(session_id)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, session_id: str, user: UserPublic) -> None:
+        """
+        캐시에 유저 정보 저장 (용량 초과 시 가장 오래 사용되지 않은 항목부터 제거)
+        """
+        self._entries.pop(session_id, None)
+        self._entries[session_id] = (time.monotonic() + self.ttl, user)
+
+        while len(self._entries) > self.maxsize:
+            oldest = next(iter(self._entries))
+            self.invalidate_session(oldest)
+
+    def invalidate_session(self, session_id: str) -> None:
+        """
+        세션 하나에 대한 캐시 삭제
+        """
+        self._entries.pop(session_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        캐시 사용 현황 (hit/miss 횟수, 현재 크기)
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+
+session_cache = SessionCache(
+    maxsize=settings.SESSION_CACHE_SIZE, ttl=settings.SESSION_CACHE_TTL
+)
+
+
+async def listen_invalidation() -> None:
+    """
+    세션 캐시 무효화 메시지 구독 (앱 실행 동안 백그라운드에서 동작)
+    - "session:<session_id>" : 세션 하나 무효화
+    """
+    while True:
+        try:
+            async with redis_client.pubsub() as pubsub:
+                await pubsub.subscribe(settings.SESSION_CACHE_CHANNEL)
+                # 구독이 끊겨 있던 동안의 메시지는 받을 수 없으므로 캐시를 비우고 시작
+                session_cache.clear()
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    kind, _, key = message["data"].decode().partition(":")
+                    if kind == "session":
+                        session_cache.invalidate_session(key)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("세션 캐시 무효화 구독이 끊어졌습니다. 재연결합니다.")
+            session_cache.clear()
+            await asyncio.sleep(1)
@@ -0,0 +1,76 @@
+import time
+from datetime import datetime
+
+from app.core.config import settings
+from app.core.security import redis_client
+
+# 게시판별 인기 점수 (sorted set, member: board_id)
+TRENDING_KEY = "board:trending"
+# 점수 계산 기준 시각 (unix time)
+TRENDING_EPOCH_KEY = "board:trending:epoch"
+
+REBASE_AFTER_HALF_LIVES = 16  # 기준 시각이 이만큼 지나면 기준 시각을 현재로 옮김
+MIN_SCORE = 2**-20  # 기준 시각을 옮길 때 이보다 점수가 낮은 게시판은 삭제
+
+# 게시글 하나의 점수 = 2 ^ ((게시글 시각 - 기준 시각) / 반감기)
+# -> 새 게시글일수록 점수가 크고, 모든 점수가 반감기마다 절반이 되는 것과 같은 순위
+# 기준 시각 갱신(점수 전체에 같은 비율 곱하기) + 점수 증감을 원자적으로 처리하기 위해 lua 사용
+_RECORD_SCRIPT = redis_client.register_script(
+    """
+local half_life = tonumber(ARGV[4])
+local now = tonumber(ARGV[5])
+local epoch = tonumber(redis.call('GET', KEYS[2]))
+
+if not epoch then
+    epoch = now
+    redis.call('SET', KEYS[2], epoch)
+elseif now - epoch > half_life * tonumber(ARGV[6]) then
+    redis.call('ZUNIONSTORE', KEYS[1], 1, KEYS[1], 'WEIGHTS', 2 ^ ((epoch - now) / half_life))
+    redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[7])
+    epoch = now
+    redis.call('SET', KEYS[2], epoch)
+end
+
+local delta = tonumber(ARGV[2]) * 2 ^ ((tonumber(ARGV[3]) - epoch) / half_life)
+local score = tonumber(redis.call('ZINCRBY', KEYS[1], delta, ARGV[1]))
+if score <= 0 then
+    redis.call('ZREM', KEYS[1], ARGV[1])
+end
+return tostring(score)
+"""
+)
+
+
+async def record(board_id: int, num: int, at: datetime | None = None) -> None:
+    """
+    게시판 인기 점수 증감 (게시글 생성 : +1, 삭제 : -1)
+    - at : 게시글 생성 시각 (삭제 시 생성 당시 더했던 점수를 그대로 빼도록)
+    """
+    now = time.time()
+    await _RECORD_SCRIPT(
+        keys=[TRENDING_KEY, TRENDING_EPOCH_KEY],
+        args=[
+            board_id,
+            num,
+            at.timestamp() if at else now,
+            settings.TRENDING_HALF_LIFE,
+            now,
+            REBASE_AFTER_HALF_LIVES,
+            MIN_SCORE,
+        ],
+    )
+
+
+async def remove_board(board_id: int) -> None:
+    """
+    삭제된 게시판을 인기 순위에서 제거
+    """
+    await redis_client.zrem(TRENDING_KEY, board_id)
+
+
+async def top(offset: int, count: int) -> list[int]:
+    """
+    인기 점수 높은 순서로 offset 부터 count 개의 게시판 ID
+    """
+    board_ids = await redis_client.zrevrange(TRENDING_KEY, offset, offset + count - 1)
+    return [int(board_id) for board_id in board_ids]
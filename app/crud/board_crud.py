@@ -1,14 +1,34 @@
+import json
 from typing import List
+from datetime import datetime
 
-from sqlalchemy.orm import Session
-from sqlalchemy import select, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete, values, column, Integer, func, text
+from sqlalchemy import and_, or_, tuple_, union_all
+from sqlalchemy.orm import aliased, joinedload
 
-from app.models import Board
+from app.models import Board, Post
 from app.schemas.board_schema import BoardCreate, BoardUpdate
+from app.core import cache, trending
+from app.core.config import settings
+from app.core.security import redis_client
 from app.utils import time
 
+# 게시판별 게시글 count 증감분을 모아두는 redis hash (coalesce 모드)
+COUNT_BUFFER_KEY = "board:count:buffer"
+# 적립분 반영(flush_count_buffer)과 count 재계산(bulk_import)을 직렬화하는 advisory lock ID
+COUNT_LOCK_ID = 7_160_001
 
-def create_board(db_session: Session, board_create: BoardCreate, user_id: int) -> Board:
+
+class BoardNotFoundError(Exception):
+    """
+    게시판을 조회한 뒤 게시글을 쓰거나 지우기 전에 게시판이 삭제된 경우
+    """
+
+
+async def create_board(
+    db_session: AsyncSession, board_create: BoardCreate, user_id: int
+) -> Board:
     """
     게시판 생성
     """
@@ -17,85 +37,367 @@ def create_board(db_session: Session, board_create: BoardCreate, user_id: int) -
     )
 
     db_session.add(board)
-    db_session.commit()
-    db_session.refresh(board)
+    await db_session.commit()
+    await invalidate_board_list(public=board.public, user_id=user_id)
+    await db_session.refresh(board)
 
     return board
 
 
-def update_board(db_session: Session, board: Board, board_update: BoardUpdate) -> Board:
+async def update_board(
+    db_session: AsyncSession, board: Board, board_update: BoardUpdate
+) -> Board:
     """
     게시판 업데이트
     """
+    was_public = board.public
     if board_update.name:
         board.name = board_update.name
     if board_update.public is not None:
         board.public = board_update.public
 
     db_session.add(board)
-    db_session.commit()
-    db_session.refresh(board)
+    await db_session.commit()
+    # 공개 <-> 비공개로 바뀌면 public 목록도 바뀜
+    await invalidate_board_list(
+        public=was_public or board.public, user_id=board.user_id
+    )
+    await db_session.refresh(board)
 
     return board
 
 
-def update_count(db_session: Session, board: Board, num: int) -> None:
+async def invalidate_board_list(public: bool, user_id: int) -> None:
+    """
+    게시판 목록 캐시 무효화
+    - public 게시판 변경 : 모든 목록이 public 게시판을 포함하므로 전체 무효화
+    - private 게시판 변경 : 게시판을 생성한 유저의 목록만 무효화
+    """
+    if public:
+        await cache.bump_version(cache.BOARD_LIST_VERSION_KEY)
+    else:
+        await cache.bump_version(cache.board_list_user_version_key(user_id))
+
+
+async def update_count(
+    db_session: AsyncSession, board_id: int, num: int
+) -> tuple[bool, int]:
     """
-    게시글 count 업데이트
+    게시글 count 업데이트 (commit은 호출하는 쪽의 트랜잭션에서)
+    - DB에서 원자적으로 증감하므로 동시에 요청이 들어와도 증감분이 유실되지 않음
     - update_date도 함께 최신화해서 최근에 글이 올라온 게시판이 어디인지 알 수 있음
+    - 리턴 : 게시판의 (public 여부, 생성한 유저 ID) -> 목록 캐시 무효화 범위
+    - 게시판이 없거나 삭제 표시된 경우 BoardNotFoundError
+      (게시글 쓰기 전에 호출하면 commit 까지 게시판 row가 lock 되어 도중에 삭제되지 않음)
     """
-    board.count += num
-    board.update_date = time.now_datetime()
-    db_session.add(board)
-    db_session.commit()
+    statement = (
+        update(Board)
+        .where(Board.id == board_id, Board.deleted == False)
+        .values(count=Board.count + num, update_date=time.now_datetime())
+        .returning(Board.public, Board.user_id)
+    )
+    row = (await db_session.execute(statement)).one_or_none()
+    if row is None:
+        raise BoardNotFoundError()
+    return tuple(row)
+
+
+async def count_committed(
+    board_id: int,
+    num: int,
+    post_date: datetime | None = None,
+    scope: tuple[bool, int] | None = None,
+) -> None:
+    """
+    게시글 생성/삭제 commit 후 처리
+    - coalesce 모드 : 게시글 count 증감분을 redis에 적립 (flush_count_buffer에서 일괄 반영)
+      -> 게시글이 많이 올라오는 게시판의 row lock 경합을 피하기 위함
+    - 일반 모드 : 이미 반영된 count로 게시판 목록 순서가 바뀌므로 게시판 목록 캐시 무효화
+      (scope : update_count가 리턴한 (public 여부, 생성한 유저 ID))
+    - 게시판 인기 점수도 증감 (post_date : 삭제한 게시글의 생성 시각, 생성이면 None)
+    """
+    if settings.BOARD_COUNT_COALESCE:
+        await redis_client.hincrby(COUNT_BUFFER_KEY, board_id, num)
+    else:
+        public, user_id = scope
+        await invalidate_board_list(public=public, user_id=user_id)
+    await trending.record(board_id=board_id, num=num, at=post_date)
 
 
-def delete_board(db_session: Session, board: Board) -> None:
+async def flush_count_buffer(db_session: AsyncSession) -> int:
     """
-    게시판 삭제 (hard delete)
+    redis에 적립된 게시판별 게시글 count 증감분을 한 번의 UPDATE로 DB에 반영
+    - 반영한 게시판 수 리턴
     """
-    db_session.delete(board)
-    db_session.commit()
+    # 재계산과 동시에 반영되지 않도록 적립분을 꺼내기 전에 lock (트랜잭션이 끝나면 해제)
+    await db_session.execute(select(func.pg_advisory_xact_lock(COUNT_LOCK_ID)))
+
+    # 적립된 증감분을 꺼내면서 비우기 (MULTI/EXEC로 원자적으로)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.hgetall(COUNT_BUFFER_KEY)
+        pipe.delete(COUNT_BUFFER_KEY)
+        buffered, _ = await pipe.execute()
+
+    deltas = sorted(
+        (int(board_id), int(num)) for board_id, num in buffered.items() if int(num)
+    )  # board_id 순서로 lock을 잡아서 deadlock 방지
+    if not deltas:
+        return 0
+
+    delta_table = values(
+        column("board_id", Integer), column("num", Integer), name="delta"
+    ).data(deltas)
+    statement = (
+        update(Board)
+        .where(Board.id == delta_table.c.board_id)
+        .values(count=Board.count + delta_table.c.num, update_date=time.now_datetime())
+        .returning(Board.public, Board.user_id)
+        .execution_options(synchronize_session=False)
+    )
+
+    try:
+        scopes = set((await db_session.execute(statement)).tuples())
+        await db_session.commit()
+    except Exception:
+        # 반영에 실패하면 다음 flush 때 다시 반영되도록 증감분을 되돌려 놓음
+        await db_session.rollback()
+        async with redis_client.pipeline(transaction=True) as pipe:
+            for board_id, num in deltas:
+                pipe.hincrby(COUNT_BUFFER_KEY, board_id, num)
+            await pipe.execute()
+        raise
+
+    # 게시판 목록 캐시 무효화 (public 게시판이 하나라도 있으면 전체)
+    if any(public for public, _ in scopes):
+        await cache.bump_version(cache.BOARD_LIST_VERSION_KEY)
+    else:
+        for _, user_id in scopes:
+            await invalidate_board_list(public=False, user_id=user_id)
+    return len(deltas)
+
+
+async def delete_board(db_session: AsyncSession, board: Board) -> None:
+    """
+    게시판 삭제
+    - 게시글은 메모리로 읽지 않고 DB의 ON DELETE CASCADE로 함께 삭제 (hard delete)
+    - 게시글이 BOARD_PURGE_THRESHOLD 개보다 많으면 삭제 표시만 하고 바로 목록 / 조회에서 제외,
+      게시글은 백그라운드에서 나눠서 삭제 (긴 lock / timeout 방지)
+    """
+    if board.count > settings.BOARD_PURGE_THRESHOLD:
+        board.deleted = True
+    else:
+        await db_session.delete(board)
+    await db_session.commit()
+    await invalidate_board_list(public=board.public, user_id=board.user_id)
+    await trending.remove_board(board_id=board.id)
+
+
+async def purge_board_posts(db_session: AsyncSession, board_id: int) -> int:
+    """
+    삭제 표시된 게시판의 게시글을 BOARD_PURGE_CHUNK_SIZE 개 삭제 -> 삭제한 게시글 수
+    - 다른 워커가 삭제 중인(lock 걸린) 게시글은 건너뜀
+    """
+    chunk = (
+        select(Post.id)
+        .filter(Post.board_id == board_id)
+        .limit(settings.BOARD_PURGE_CHUNK_SIZE)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    result = await db_session.execute(
+        delete(Post)
+        .where(Post.id.in_(chunk))
+        .execution_options(synchronize_session=False)
+    )
+    await db_session.commit()
+    return result.rowcount
+
+
+async def purge_deleted_boards(db_session: AsyncSession) -> int:
+    """
+    삭제 표시된 게시판들을 게시글부터 나눠서 삭제 -> 삭제한 게시판 수
+    """
+    board_ids = (
+        await db_session.scalars(select(Board.id).filter(Board.deleted == True))
+    ).all()
+
+    for board_id in board_ids:
+        while await purge_board_posts(db_session=db_session, board_id=board_id):
+            pass
+        # 남은 게시글(다른 워커가 삭제 중이던 chunk)은 ON DELETE CASCADE로 삭제
+        await db_session.execute(delete(Board).where(Board.id == board_id))
+        await db_session.commit()
 
+    return len(board_ids)
 
-def get_board_by_id(db_session: Session, id: int) -> Board | None:
+
+async def get_board_by_id(db_session: AsyncSession, id: int) -> Board | None:
     """
-    ID로 게시판 정보 읽기
+    ID로 게시판 정보 읽기 (삭제 표시된 게시판은 None)
     """
-    return db_session.get(Board, id)
+    board = await db_session.get(Board, id)
+    if board and board.deleted:
+        return None
+    return board
 
 
-def get_board_by_name(db_session: Session, name: str) -> Board | None:
+async def get_board_by_name(db_session: AsyncSession, name: str) -> Board | None:
     """
-    이름으로 게시판 정보 읽기
+    이름으로 게시판 정보 읽기 (삭제 표시된 게시판 포함, 이름은 정리가 끝날 때까지 유지됨)
     """
     statement = select(Board).filter_by(name=name)
-    user = db_session.execute(statement).scalar_one_or_none()
+    user = (await db_session.execute(statement)).scalar_one_or_none()
     return user
 
 
-def get_boards(
-    db_session: Session, user_id: int | None, offset: int, limit: int
+def accessible_filter(user_id: int | None):
+    """
+    접근 가능한 게시판 조건 (public이거나, 로그인 상태면 본인이 생성한 private 게시판, 삭제 표시 X)
+    """
+    if isinstance(user_id, int):
+        return and_(
+            Board.deleted == False,
+            or_(Board.public == True, Board.user_id == user_id),
+        )
+    return and_(Board.deleted == False, Board.public == True)
+
+
+def _rank_order(target) -> tuple:
+    """
+    게시판 목록 정렬 기준 (count, update_date, id 역순)
+    """
+    return (target.count.desc(), target.update_date.desc(), target.id.desc())
+
+
+async def get_boards(
+    db_session: AsyncSession,
+    user_id: int | None,
+    limit: int,
+    offset: int = 0,
+    cursor: tuple[int, datetime, int] | None = None,
 ) -> List[Board] | None:
     """
-    접근 가능한 게시판 목록 조회 (offset pagination, 게시판 내 게시글 많은 순서로..)
+    접근 가능한 게시판 목록 조회 (게시판 내 게시글 많은 순서로..)
+    - offset pagination 또는 cursor pagination (cursor : 이전 페이지 마지막 게시판의 (count, update_date, id))
+    - 공개 범위(public / 본인 private)별 partial index로 각각 조회한 뒤 합침
     """
+    # 로그인 상태 X : public인 게시판들만 모음
+    scopes = [Board.public == True]
     if isinstance(user_id, int):
-        # 로그인 상태 O : public이거나, private면서 본인이 생성한 게시판들
-        statement = select(Board).filter(
-            or_(
-                Board.public == True,
-                and_(Board.public == False, Board.user_id == user_id),
+        # 로그인 상태 O : 본인이 생성한 private 게시판들도 포함
+        scopes.append(and_(Board.public == False, Board.user_id == user_id))
+
+    statements = []
+    for scope in scopes:
+        statement = select(Board).filter(scope, Board.deleted == False)
+        if cursor:
+            # cursor 이후의 게시판들 (인덱스 seek)
+            statement = statement.filter(
+                tuple_(Board.count, Board.update_date, Board.id) < cursor
             )
-        )
+        statements.append(statement)
+
+    if len(statements) == 1:
+        target = Board
+        statement = statements[0]
     else:
-        # 로그인 상태 X : public인 게시판들만 모음
-        statement = select(Board).filter(Board.public == True)
+        # 각 범위에서 offset + limit 개씩만 가져와서 합친 뒤 다시 정렬
+        subqueries = [
+            select(
+                statement.order_by(*_rank_order(Board)).limit(offset + limit).subquery()
+            )
+            for statement in statements
+        ]
+        target = aliased(Board, union_all(*subqueries).subquery())
+        statement = select(target)
 
     statement = statement.order_by(
-        Board.count.desc(), Board.update_date.desc()
+        *_rank_order(target)
     )  # 게시글 수 기준 정렬, 게시글 수가 같으면 최근에 게시글이 올라온 순으로
-    statement = statement.offset(offset).limit(limit)  # offset 페이징 적용
+    statement = statement.offset(offset).limit(limit)  # 페이징 적용
+    # 게시판 생성한 유저 정보도 같은 쿼리에서 함께 읽기 (N+1 방지)
+    statement = statement.options(joinedload(target.user))
 
-    boards = db_session.execute(statement).scalars().all()
+    boards = (await db_session.execute(statement)).scalars().all()
     return boards
+
+
+async def get_trending_boards(
+    db_session: AsyncSession, user_id: int | None, limit: int, offset: int = 0
+) -> List[Board]:
+    """
+    인기 점수(최근 게시글 수 기반) 높은 순서로 접근 가능한 게시판 목록 조회
+    - redis sorted set에서 순위대로 게시판 ID를 읽고, DB에서는 ID로 한 번에 조회
+    - 접근할 수 없는 private 게시판은 건너뛰므로 offset + limit 개가 찰 때까지 순위를 이어서 읽음
+    """
+    needed = offset + limit
+    chunk_size = max(needed, settings.TRENDING_SCAN_SIZE)
+    boards: List[Board] = []
+    position = 0
+
+    while len(boards) < needed:
+        board_ids = await trending.top(offset=position, count=chunk_size)
+        if not board_ids:
+            break
+        position += len(board_ids)
+
+        statement = (
+            select(Board)
+            .filter(Board.id.in_(board_ids), accessible_filter(user_id))
+            .options(joinedload(Board.user))
+        )
+        found = {board.id: board for board in (await db_session.scalars(statement))}
+        boards.extend(found[board_id] for board_id in board_ids if board_id in found)
+
+        if len(board_ids) < chunk_size:  # 순위 끝
+            break
+
+    return boards[offset:needed]
+
+
+async def estimate_public_boards(db_session: AsyncSession) -> int:
+    """
+    public 게시판 수 추정치 (postgres 통계 기반 실행 계획의 예상 row 수, 테이블을 읽지 않음)
+    """
+    plan = await db_session.scalar(
+        text(
+            "EXPLAIN (FORMAT JSON) SELECT 1 FROM board WHERE public = true AND NOT deleted"
+        )
+    )
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_boards(
+    db_session: AsyncSession, user_id: int | None
+) -> tuple[int, bool]:
+    """
+    접근 가능한 게시판 수 -> (게시판 수, 정확한 값인지 여부)
+    - public 게시판 : 통계 추정치가 BOARD_TOTAL_EXACT_LIMIT 이하면 partial index로 정확히 세고, 아니면 추정치
+    - 본인 private 게시판 : (user_id) partial index로 항상 정확히 셈
+    """
+    total = await estimate_public_boards(db_session=db_session)
+    is_exact = False
+    if total <= settings.BOARD_TOTAL_EXACT_LIMIT:
+        statement = (
+            select(func.count())
+            .select_from(Board)
+            .filter(Board.public == True, Board.deleted == False)
+        )
+        total = await db_session.scalar(statement)
+        is_exact = True
+
+    if isinstance(user_id, int):
+        statement = (
+            select(func.count())
+            .select_from(Board)
+            .filter(
+                Board.public == False,
+                Board.user_id == user_id,
+                Board.deleted == False,
+            )
+        )
+        total += await db_session.scalar(statement)
+
+    return total, is_exact
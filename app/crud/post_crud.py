@@ -1,19 +1,23 @@
 from typing import List
 from datetime import datetime
 
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.orm import joinedload, defer, with_expression
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncScalarResult
+from sqlalchemy import select, insert, tuple_, func, Float
 
-from app.models import Post
+from app.models import Post, Board
 from app.schemas.post_schema import PostCreate, PostUpdate
+from app.core.config import settings
+from app.crud import board_crud
 from app.utils import time
 
 
-def create_post(
-    db_session: Session, post_create: PostCreate, user_id: int, board_id: int
+async def create_post(
+    db_session: AsyncSession, post_create: PostCreate, user_id: int, board_id: int
 ) -> Post:
     """
     게시글 생성
+    - 게시판의 게시글 count도 같은 트랜잭션에서 증가 (coalesce 모드면 commit 후 적립)
     """
     post = Post(
         title=post_create.title,
@@ -22,21 +26,75 @@ def create_post(
         board_id=board_id,
     )
 
+    scope = None
+    if not settings.BOARD_COUNT_COALESCE:
+        scope = await board_crud.update_count(
+            db_session=db_session, board_id=board_id, num=1
+        )
     db_session.add(post)
-    db_session.commit()
-    db_session.refresh(post)
+    await db_session.commit()
+    await board_crud.count_committed(board_id=board_id, num=1, scope=scope)
+    await db_session.refresh(post)
 
     return post
 
 
-def get_post_by_id(db_session: Session, id: int) -> Post | None:
+async def create_posts(
+    db_session: AsyncSession,
+    post_creates: List[PostCreate],
+    user_id: int,
+    board_id: int,
+) -> List[Post]:
     """
-    ID로 게시글 읽기
+    게시글 일괄 생성 (multi-row INSERT ... RETURNING 한 번으로)
+    - 게시판의 게시글 count도 같은 트랜잭션에서 한 번에 증가 (coalesce 모드면 commit 후 적립)
     """
-    return db_session.get(Post, id)
+    statement = insert(Post).returning(Post, sort_by_parameter_order=True)
+    rows = [
+        {
+            "title": post_create.title,
+            "content": post_create.content,
+            "user_id": user_id,
+            "board_id": board_id,
+        }
+        for post_create in post_creates
+    ]
+
+    num = len(rows)
+    scope = None
+    if not settings.BOARD_COUNT_COALESCE:
+        scope = await board_crud.update_count(
+            db_session=db_session, board_id=board_id, num=num
+        )
+    posts = (await db_session.scalars(statement, rows)).all()
+    await db_session.commit()
+    await board_crud.count_committed(board_id=board_id, num=num, scope=scope)
+
+    return posts
 
 
-def update_post(db_session: Session, post: Post, post_update: PostUpdate) -> Post:
+async def get_post_with_board(
+    db_session: AsyncSession, board_id: int, post_id: int
+) -> tuple[Board, Post | None] | None:
+    """
+    게시판 + 게시글 + 게시글을 쓴 유저를 한 번의 쿼리로 읽기
+    - 게시판이 없으면(삭제 표시 포함) None, 게시글이 없으면 (게시판, None)
+    - 게시글은 다른 게시판의 것일 수도 있음 (관계 체크는 호출하는 쪽에서)
+    - 게시글 본문(content)은 필요할 때 읽도록 지연 로딩
+    """
+    statement = (
+        select(Board, Post)
+        .outerjoin(Post, Post.id == post_id)
+        .filter(Board.id == board_id, Board.deleted == False)
+        .options(defer(Post.content), joinedload(Post.user))
+    )
+    row = (await db_session.execute(statement)).one_or_none()
+    return tuple(row) if row else None
+
+
+async def update_post(
+    db_session: AsyncSession, post: Post, post_update: PostUpdate
+) -> Post:
     """
     게시글 업데이트
     """
@@ -47,35 +105,121 @@ def update_post(db_session: Session, post: Post, post_update: PostUpdate) -> Pos
     post.update_date = time.now_datetime()
 
     db_session.add(post)
-    db_session.commit()
-    db_session.refresh(post)
+    await db_session.commit()
+    await db_session.refresh(post)
+    await post.awaitable_attrs.content  # 지연 로딩된 본문도 응답에 포함되도록
 
     return post
 
 
-def delete_post(db_session: Session, post: Post) -> None:
+async def delete_post(db_session: AsyncSession, post: Post) -> None:
     """
     게시글 삭제 (hard delete)
+    - 게시판의 게시글 count도 같은 트랜잭션에서 감소 (coalesce 모드면 commit 후 적립)
     """
-    db_session.delete(post)
-    db_session.commit()
+    scope = None
+    if not settings.BOARD_COUNT_COALESCE:
+        scope = await board_crud.update_count(
+            db_session=db_session, board_id=post.board_id, num=-1
+        )
+    await db_session.delete(post)
+    await db_session.commit()
+    await board_crud.count_committed(
+        board_id=post.board_id, num=-1, post_date=post.create_date, scope=scope
+    )
 
 
-def get_posts_in_board(
-    db_session: Session, board_id: int, limit: int, cursor: datetime | None = None
+async def get_posts_in_board(
+    db_session: AsyncSession,
+    board_id: int,
+    limit: int,
+    cursor: tuple[datetime, int] | None = None,
+    with_content: bool = True,
+    with_user: bool = True,
+    excerpt_length: int | None = None,
 ) -> List[Post] | None:
     """
     게시판 내의 게시글들을 cursor pagining 하여 리턴 (최신 게시글 순서로..)
+    - cursor : 이전 페이지 마지막 게시글의 (create_date, id)
+    - (board_id, create_date DESC, id DESC) 인덱스 범위 스캔으로 처리됨
+    - with_content=False : 본문 컬럼은 읽지 않음 (접근하면 추가 쿼리)
+    - with_user : 게시글을 쓴 유저 정보를 같은 쿼리에서 join 하여 로딩
+    - excerpt_length : 본문 앞부분을 DB에서 잘라서 Post.excerpt 로 로딩
     """
     # 게시판 내 게시글들
     statement = select(Post).filter_by(board_id=board_id)
 
+    if not with_content:
+        statement = statement.options(defer(Post.content))
+    if with_user:
+        statement = statement.options(joinedload(Post.user))
+    if excerpt_length:
+        statement = statement.options(
+            with_expression(Post.excerpt, func.substr(Post.content, 1, excerpt_length))
+        )
+
     if cursor:
-        # cursor보다 생성시간이 늦은 아이템들
-        statement = statement.filter(Post.create_date < cursor)
+        # cursor보다 생성시간이 늦은 아이템들 (생성시간이 같으면 id로 구분)
+        statement = statement.filter(tuple_(Post.create_date, Post.id) < cursor)
 
-    # create_date 역순으로 정렬, limite 적용
-    statement = statement.order_by(Post.create_date.desc()).limit(limit)
+    # (create_date, id) 역순으로 정렬, limite 적용
+    statement = statement.order_by(Post.create_date.desc(), Post.id.desc()).limit(limit)
 
-    posts = db_session.execute(statement).scalars().all()
+    posts = (await db_session.execute(statement)).scalars().all()
     return posts
+
+
+async def stream_posts_in_board(
+    db_session: AsyncSession, board_id: int, chunk_size: int
+) -> AsyncScalarResult[Post]:
+    """
+    게시판 내의 모든 게시글을 서버 측 커서로 chunk_size 개씩 읽음 (오래된 게시글 순서로..)
+    - 게시판 크기와 상관없이 메모리에는 chunk_size 개의 게시글만 유지
+    - 게시글을 쓴 유저 정보는 같은 쿼리에서 join 하여 로딩
+    """
+    statement = (
+        select(Post)
+        .filter_by(board_id=board_id)
+        .options(joinedload(Post.user))
+        .order_by(Post.create_date, Post.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    return await db_session.stream_scalars(statement)
+
+
+async def search_posts(
+    db_session: AsyncSession,
+    query: str,
+    user_id: int | None,
+    limit: int,
+    board_id: int | None = None,
+    cursor: tuple[float, int] | None = None,
+) -> List[tuple[Post, float]]:
+    """
+    게시글 제목 + 본문 전문 검색 (검색어와 관련도 높은 순서로..)
+    - board_id가 없으면 접근 가능한 모든 게시판에서 검색
+    - cursor : 이전 페이지 마지막 게시글의 (관련도, id)
+    - (게시글, 관련도) 목록 리턴
+    """
+    ts_query = func.websearch_to_tsquery("simple", query)
+    rank = func.ts_rank(Post.search_vector, ts_query, type_=Float)
+
+    # GIN 인덱스로 검색어가 포함된 게시글들
+    statement = select(Post, rank).filter(Post.search_vector.op("@@")(ts_query))
+
+    if board_id is not None:
+        statement = statement.filter(Post.board_id == board_id)
+    else:
+        statement = statement.join(Board, Post.board_id == Board.id).filter(
+            board_crud.accessible_filter(user_id)
+        )
+
+    if cursor:
+        # cursor보다 관련도가 낮은 아이템들 (관련도가 같으면 id로 구분)
+        statement = statement.filter(tuple_(rank, Post.id) < cursor)
+
+    statement = statement.order_by(rank.desc(), Post.id.desc()).limit(limit)
+    statement = statement.options(joinedload(Post.user))
+
+    results = (await db_session.execute(statement)).all()
+    return [(post, post_rank) for post, post_rank in results]
@@ -1,9 +1,78 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from functools import partial
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette import status
 
+from app import background
 from app.api.main import api_router
+from app.crud import board_crud
+from app.core import session_cache, security, metrics, query_budget
+from app.core.config import settings
+from app.core.db import engine, replica_engines, engine_pool_status
+from app.core.middleware import (
+    PrimaryStickyMiddleware,
+    MetricsMiddleware,
+    ConcurrencyLimitMiddleware,
+    ConcurrencyLimiter,
+    AUTH_GROUP,
+    WRITE_GROUP,
+    LIST_READ_GROUP,
+    EXPORT_GROUP,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 백그라운드 작업 시작 : 세션 캐시 무효화 메시지 구독, 삭제 표시된 게시판 정리
+    tasks = [
+        asyncio.create_task(session_cache.listen_invalidation()),
+        asyncio.create_task(background.purge_deleted_boards()),
+    ]
+    if settings.BOARD_COUNT_COALESCE:  # 게시판 게시글 count 주기적 반영
+        tasks.append(asyncio.create_task(background.flush_board_count()))
+
+    yield
+
+    # 백그라운드 작업 종료
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    security.shutdown_hash_pool()
+
+
+app = FastAPI(
+    title="게시판 API 서버",
+    version="0.0.1",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # 응답 JSON 직렬화는 orjson으로
+)
 
-app = FastAPI(title="게시판 API 서버", version="0.0.1")
+# 라우트 그룹별 동시 처리 수 제한
+# - CORS 보다 먼저 추가 -> CORS 안쪽에서 실행되어 503 응답에도 CORS 헤더가 붙음
+concurrency_limiters = {
+    group: ConcurrencyLimiter(limit, queue_size, settings.CONCURRENCY_QUEUE_TIMEOUT)
+    for group, limit, queue_size in (
+        (AUTH_GROUP, settings.AUTH_CONCURRENCY_LIMIT, settings.AUTH_QUEUE_SIZE),
+        (WRITE_GROUP, settings.WRITE_CONCURRENCY_LIMIT, settings.WRITE_QUEUE_SIZE),
+        (
+            LIST_READ_GROUP,
+            settings.LIST_READ_CONCURRENCY_LIMIT,
+            settings.LIST_READ_QUEUE_SIZE,
+        ),
+        (EXPORT_GROUP, settings.EXPORT_CONCURRENCY_LIMIT, settings.EXPORT_QUEUE_SIZE),
+    )
+    if limit > 0
+}
+if concurrency_limiters:
+    app.add_middleware(
+        ConcurrencyLimitMiddleware,
+        limiters=concurrency_limiters,
+        retry_after=settings.CONCURRENCY_RETRY_AFTER,
+    )
 
 # 허용 origin 목록
 origins = [
@@ -20,4 +89,56 @@ app.add_middleware(
     allow_headers=["*"],  # 모든 헤더 허용
 )
 
+if replica_engines:  # 쓰기 요청 직후에는 primary에서 읽도록
+    app.add_middleware(
+        PrimaryStickyMiddleware, max_age=settings.DB_REPLICA_STICKY_SECONDS
+    )
+
+if settings.METRICS_ENABLED:  # 요청 / SQL 시간 + 커넥션 풀, 세션 캐시 현황 수집
+    metrics.instrument_engine(engine, "primary")
+    for i, replica_engine in enumerate(replica_engines):
+        metrics.instrument_engine(replica_engine, f"replica{i}")
+    metrics.register_stats(
+        "db_pool", partial(engine_pool_status, engine), "커넥션 풀 현황"
+    )
+    for i, replica_engine in enumerate(replica_engines):
+        metrics.register_stats(
+            f"db_pool_replica{i}",
+            partial(engine_pool_status, replica_engine),
+            "replica 커넥션 풀 현황",
+        )
+    metrics.register_stats(
+        "session_cache", session_cache.session_cache.stats, "세션 캐시 현황"
+    )
+    for group, limiter in concurrency_limiters.items():
+        metrics.register_stats(
+            f"concurrency_{group}", limiter.stats, "라우트 그룹별 동시 처리 현황"
+        )
+    app.add_middleware(MetricsMiddleware)
+
+if settings.QUERY_DEBUG:  # 요청별 쿼리 수 추적 (개발 / 테스트용)
+    for db_engine in (engine, *replica_engines):
+        query_budget.instrument_engine(db_engine)
+
 app.include_router(api_router)
+
+
+@app.exception_handler(board_crud.BoardNotFoundError)
+async def board_not_found_handler(request: Request, exc: Exception):
+    # 게시판을 조회한 뒤 게시글을 쓰거나 지우기 전에 게시판이 삭제된 경우
+    return ORJSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={"detail": "존재하지 않는 게시판입니다."},
+    )
+
+
+@app.exception_handler(security.PasswordHashBusyError)
+async def password_hash_busy_handler(request: Request, exc: Exception):
+    # 비밀번호 연산 대기열이 가득 찬 경우 기다리지 않고 바로 503
+    return ORJSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "detail": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."
+        },
+        headers={"Retry-After": str(settings.PASSWORD_HASH_RETRY_AFTER)},
+    )
@@ -2,11 +2,13 @@ from typing import Optional, List
 from typing_extensions import Annotated
 from datetime import datetime
 
-from sqlalchemy import String, Text, ForeignKey, TIMESTAMP
-from sqlalchemy import func
+from sqlalchemy import String, Text, ForeignKey, TIMESTAMP, Index, Computed
+from sqlalchemy import func, false
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, query_expression
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.asyncio import AsyncAttrs
+from sqlalchemy.dialects.postgresql import TSVECTOR
 
 # * mapped_column() overrides
 int_pk = Annotated[int, mapped_column(primary_key=True)]
@@ -17,7 +19,8 @@ str30 = Annotated[str, mapped_column(String(30))]
 text = Annotated[str, mapped_column(Text)]
 
 
-class Base(DeclarativeBase):
+# AsyncAttrs : await obj.awaitable_attrs.<속성> 으로 lazy load 가능
+class Base(AsyncAttrs, DeclarativeBase):
     pass
 
 
@@ -31,12 +34,13 @@ class User(Base):  # 사용자 테이블
     password: Mapped[str]
 
     # 유저가 생성한 게시판들
+    # ? passive_deletes=True : 삭제 시 하위 row를 읽지 않고 DB의 ON DELETE CASCADE로 삭제
     boards: Mapped[List["Board"]] = relationship(
-        back_populates="user", cascade="all, delete"
+        back_populates="user", cascade="all, delete", passive_deletes=True
     )
     # 유저가 쓴 게시글들
     posts: Mapped[List["Post"]] = relationship(
-        back_populates="user", cascade="all, delete"
+        back_populates="user", cascade="all, delete", passive_deletes=True
     )
 
 
@@ -50,12 +54,14 @@ class Board(Base):  # 게시판 테이블
     create_date: Mapped[date] = mapped_column(insert_default=func.now())
     update_date: Mapped[date] = mapped_column(insert_default=func.now())
     user_id: Mapped[user_fk]
+    # 삭제 표시 (게시글이 많은 게시판은 숨긴 뒤 백그라운드에서 게시글을 나눠서 삭제)
+    deleted: Mapped[bool] = mapped_column(default=False, server_default=false())
 
     # 게시판 생성한 유저
     user: Mapped["User"] = relationship(back_populates="boards")
     # 게시판 내 게시글들
     posts: Mapped[List["Post"]] = relationship(
-        back_populates="board", cascade="all, delete"
+        back_populates="board", cascade="all, delete", passive_deletes=True
     )
 
 
@@ -69,8 +75,47 @@ class Post(Base):  # 게시글 테이블
     update_date: Mapped[date] = mapped_column(insert_default=func.now())
     user_id: Mapped[user_fk]
     board_id: Mapped[board_fk]
+    # 제목 + 본문 전문 검색용 (DB에서 자동 생성, 조회 시에는 읽지 않음)
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', title || ' ' || content)", persisted=True),
+        deferred=True,
+    )
+    # 본문 미리보기 (조회 시 with_expression 으로 DB에서 잘라서 채움, 컬럼 X)
+    excerpt: Mapped[Optional[str]] = query_expression()
 
     # 게시글을 쓴 유저
     user: Mapped["User"] = relationship(back_populates="posts")
     # 게시글이 등록된 게시판
     board: Mapped["Board"] = relationship(back_populates="posts")
+
+
+# 게시판 내 게시글 목록 조회 (cursor pagination) 용 인덱스
+Index(
+    "ix_post_board_id_create_date_id",
+    Post.board_id,
+    Post.create_date.desc(),
+    Post.id.desc(),
+)
+
+# 게시글 전문 검색용 GIN 인덱스
+Index("ix_post_search_vector", Post.search_vector, postgresql_using="gin")
+
+# 게시판 목록 조회 (public 게시판들) 용 partial 인덱스
+Index(
+    "ix_board_public_rank",
+    Board.count.desc(),
+    Board.update_date.desc(),
+    Board.id.desc(),
+    postgresql_where=Board.public == True,
+)
+
+# 게시판 목록 조회 (유저별 private 게시판들) 용 partial 인덱스
+Index(
+    "ix_board_private_user_id_rank",
+    Board.user_id,
+    Board.count.desc(),
+    Board.update_date.desc(),
+    Board.id.desc(),
+    postgresql_where=Board.public == False,
+)
@@ -1,7 +1,7 @@
 from typing import List
 from datetime import datetime
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import AliasChoices, BaseModel, Field, model_validator
 
 from app.utils.validators import check_all_empty
 from app.schemas.user_schema import UserBase
@@ -18,7 +18,11 @@ class BoardPublic(BoardCreate):
     user_id: int = Field(default=..., description="게시판 생성한 유저 ID")
     create_date: datetime = Field(default=..., description="게시판이 생성된 시각")
     update_date: datetime = Field(default=..., description="게시판 최근 업데이트 시각")
-    user_info: UserBase = Field(default=..., description="게시판 생성한 유저 정보")
+    user_info: UserBase = Field(
+        default=...,
+        validation_alias=AliasChoices("user_info", "user"),  # ORM 객체는 user 속성
+        description="게시판 생성한 유저 정보",
+    )
 
     class Config:
         from_attributes = True
@@ -32,8 +36,20 @@ class BoardUpdate(BaseModel):
 
 
 class BoardList(BaseModel):
-    page: int = Field(default=..., description="현재 페이지 번호")
+    page: int | None = Field(
+        default=None, description="현재 페이지 번호 (cursor로 조회한 경우 null)"
+    )
     limit: int = Field(default=..., description="페이지 당 게시판 수")
     board_list: List[BoardPublic] | None = Field(
         default=None, title="접근 가능한 게시판 목록"
     )
+    next_cursor: str | None = Field(
+        default=None,
+        description="다음 페이지 조회에 사용할 cursor (마지막 페이지면 null)",
+    )
+    total: int | None = Field(
+        default=None, description="접근 가능한 게시판 수 (trending 정렬이면 null)"
+    )
+    total_is_exact: bool = Field(
+        default=..., description="total이 정확한 값인지 (false면 추정치)"
+    )
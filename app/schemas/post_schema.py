@@ -1,7 +1,7 @@
 from typing import List
 from datetime import datetime
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import AliasChoices, BaseModel, Field, model_validator
 
 from app.utils.validators import check_all_empty
 from app.schemas.user_schema import UserBase
@@ -18,7 +18,11 @@ class PostPublic(PostCreate):
     board_id: int = Field(default=..., description="게시글이 속한 게시판 ID")
     create_date: datetime = Field(default=..., description="게시글이 생성된 시각")
     update_date: datetime = Field(default=..., description="게시글 최근 업데이트 시각")
-    user_info: UserBase = Field(default=..., description="게시글을 쓴 유저 정보")
+    user_info: UserBase = Field(
+        default=...,
+        validation_alias=AliasChoices("user_info", "user"),  # ORM 객체는 user 속성
+        description="게시글을 쓴 유저 정보",
+    )
 
     class Config:
         from_attributes = True
@@ -31,9 +35,72 @@ class PostUpdate(BaseModel):
     validator = model_validator(mode="before")(check_all_empty)
 
 
+# 게시글 목록 조회 시 fields 로 고를 수 있는 항목 (id는 항상 포함)
+POST_LIST_FIELDS = (
+    "title",
+    "content",
+    "user_id",
+    "board_id",
+    "create_date",
+    "update_date",
+    "user_info",
+)
+
+
+class PostListItem(BaseModel):
+    """
+    게시글 목록의 게시글 (요청한 항목만 포함, 요청하지 않은 항목은 응답에서 빠짐)
+    """
+
+    id: int = Field(default=..., description="게시글 ID")
+    title: str | None = Field(default=None, description="게시글 제목")
+    content: str | None = Field(default=None, description="게시글 내용")
+    excerpt: str | None = Field(
+        default=None, description="게시글 내용 미리보기 (excerpt 길이만큼 자른 내용)"
+    )
+    user_id: int | None = Field(default=None, description="게시글 생성한 유저 ID")
+    board_id: int | None = Field(default=None, description="게시글이 속한 게시판 ID")
+    create_date: datetime | None = Field(
+        default=None, description="게시글이 생성된 시각"
+    )
+    update_date: datetime | None = Field(
+        default=None, description="게시글 최근 업데이트 시각"
+    )
+    user_info: UserBase | None = Field(
+        default=None, description="게시글을 쓴 유저 정보"
+    )
+
+
 class PostList(BaseModel):
     board_id: int = Field(default=..., description="게시글들이 속한 게시판 ID")
     limit: int = Field(default=..., description="페이지 당 게시글 수")
-    post_list: List[PostPublic] | None = Field(
+    post_list: List[PostListItem] | None = Field(
         default=None, title="현재 페이지의 게시글 목록"
     )
+    next_cursor: str | None = Field(
+        default=None,
+        description="다음 페이지 조회에 사용할 cursor (마지막 페이지면 null)",
+    )
+    total: int = Field(default=..., description="게시판 내 게시글 수")
+    total_is_exact: bool = Field(
+        default=..., description="total이 정확한 값인지 (false면 추정치)"
+    )
+
+
+class PostSearchResult(PostPublic):
+    rank: float = Field(default=..., description="검색어와의 관련도")
+
+
+class PostSearchList(BaseModel):
+    query: str = Field(default=..., description="검색어")
+    board_id: int | None = Field(
+        default=None, description="검색한 게시판 ID (전체 게시판에서 검색한 경우 null)"
+    )
+    limit: int = Field(default=..., description="페이지 당 게시글 수")
+    post_list: List[PostSearchResult] | None = Field(
+        default=None, title="현재 페이지의 검색 결과 (관련도 높은 순서)"
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="다음 페이지 조회에 사용할 cursor (마지막 페이지면 null)",
+    )
@@ -0,0 +1,37 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class DBEnginePoolStatus(BaseModel):
+    size: int = Field(default=..., description="커넥션 풀 크기 (DB_POOL_SIZE)")
+    checked_in: int = Field(default=..., description="풀에서 쉬고 있는 커넥션 수")
+    checked_out: int = Field(default=..., description="사용 중인 커넥션 수")
+    overflow: int = Field(default=..., description="풀 크기를 넘어서 만든 커넥션 수")
+    max_overflow: int = Field(
+        default=..., description="풀 크기를 넘어서 만들 수 있는 최대 커넥션 수"
+    )
+    wait_count: int = Field(default=..., description="커넥션을 얻은 횟수")
+    wait_time_total: float = Field(
+        default=...,
+        description="커넥션을 얻기까지 기다린 시간 합계 (초, 새 커넥션 연결 시간 제외)",
+    )
+    wait_time_max: float = Field(
+        default=..., description="커넥션을 얻기까지 가장 오래 기다린 시간 (초)"
+    )
+    timeouts: int = Field(
+        default=..., description="제한 시간 안에 커넥션을 얻지 못한 횟수"
+    )
+    connect_count: int = Field(default=..., description="새 커넥션을 맺은 횟수")
+    connect_time_total: float = Field(
+        default=..., description="새 커넥션을 맺는 데 걸린 시간 합계 (초)"
+    )
+    connect_time_max: float = Field(
+        default=..., description="새 커넥션을 맺는 데 가장 오래 걸린 시간 (초)"
+    )
+
+
+class DBPoolStatus(DBEnginePoolStatus):  # primary 풀 현황 + replica별 풀 현황
+    replicas: List[DBEnginePoolStatus] = Field(
+        default=[], description="replica별 커넥션 풀 현황 (DB_REPLICA_URLS 순서)"
+    )
@@ -0,0 +1,47 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import Any
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    페이지네이션 cursor 값들을 불투명한(opaque) 문자열로 인코딩
+    - datetime 값은 isoformat 문자열로 변환
+    """
+    payload = [
+        value.isoformat() if isinstance(value, datetime) else value for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple:
+    """
+    encode_cursor로 만든 문자열을 types 순서대로 디코딩
+    - 형식이 맞지 않으면 ValueError 발생
+    """
+    try:
+        raw = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError("잘못된 cursor 값입니다.")
+
+    if not isinstance(payload, list) or len(payload) != len(types):
+        raise ValueError("잘못된 cursor 값입니다.")
+
+    values = []
+    for value, value_type in zip(payload, types):
+        try:
+            if value_type is datetime:
+                values.append(datetime.fromisoformat(value))
+            elif isinstance(value, value_type) and not isinstance(value, bool):
+                values.append(value)
+            elif value_type is float and isinstance(value, int):
+                values.append(float(value))
+            else:
+                raise TypeError
+        except (ValueError, TypeError):
+            raise ValueError("잘못된 cursor 값입니다.")
+
+    return tuple(values)
@@ -0,0 +1,42 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+
+
+def make_etag(id: int, update_date: datetime, *values) -> str:
+    """
+    리소스의 strong ETag 생성 (id + 최근 업데이트 시각)
+    - values : update_date를 바꾸지 않고 수정되는 응답 항목들 (ex. 게시판 이름, public 여부)
+    """
+    etag = f"{id}-{int(update_date.timestamp() * 1_000_000)}"
+    if values:
+        digest = hashlib.blake2b(repr(values).encode(), digest_size=8).hexdigest()
+        etag = f"{etag}-{digest}"
+    return f'"{etag}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    If-None-Match 헤더 값에 현재 ETag가 포함되어 있는지 체크
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in tags
+
+
+def cache_headers(etag: str, update_date: datetime, public: bool) -> dict[str, str]:
+    """
+    조건부 요청(If-None-Match)용 응답 헤더
+    - private 게시판의 리소스는 공유 캐시(프록시 등)에 저장되지 않도록 private 지정
+    """
+    return {
+        "ETag": etag,
+        "Last-Modified": format_datetime(
+            update_date.astimezone(timezone.utc), usegmt=True
+        ),
+        "Cache-Control": "no-cache" if public else "private, no-cache",
+    }
@@ -0,0 +1,41 @@
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from starlette import status
+
+
+def model_response(
+    content: BaseModel,
+    status_code: int = status.HTTP_200_OK,
+    headers: dict[str, str] | None = None,
+    exclude_unset: bool = False,
+) -> Response:
+    """
+    이미 검증된 응답 스키마 객체를 그대로 JSON 응답으로 변환
+    - pydantic의 미리 컴파일된 serializer로 바로 직렬화 (response_model 재검증 X)
+    - exclude_unset : 값을 지정하지 않은 항목은 응답에서 제외
+    """
+    return Response(
+        content=content.model_dump_json(exclude_unset=exclude_unset),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+def adapter_response(
+    adapter: TypeAdapter,
+    content: Any,
+    status_code: int = status.HTTP_200_OK,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """
+    TypeAdapter(ex. 스키마 리스트)로 검증된 값을 그대로 JSON 응답으로 변환
+    """
+    return Response(
+        content=adapter.dump_json(content),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
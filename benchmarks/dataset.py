@@ -0,0 +1,160 @@
+"""
+벤치마크용 결정적(deterministic) 데이터셋
+- 같은 파라미터 + seed 면 항상 같은 유저 / 게시판 / 게시글이 같은 ID로 만들어짐
+- 시딩(seed.py)과 시나리오(run.py, micro.py)가 같은 데이터셋 정의를 공유
+"""
+
+import argparse
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+PASSWORD = "bench-password"  # 모든 벤치마크 유저 공통 비밀번호
+BASE_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)  # 생성 시각 기준점
+
+# 게시글 본문에 쓰는 단어 (검색 시나리오에서도 사용)
+WORDS = (
+    "python fastapi sqlalchemy postgres redis async cache index query board "
+    "post user session cursor page search benchmark latency throughput pool"
+).split()
+
+
+@dataclass(frozen=True)
+class BenchUser:
+    id: int
+    email: str
+    full_name: str
+
+
+@dataclass(frozen=True)
+class BenchBoard:
+    id: int
+    name: str
+    public: bool
+    user_id: int
+    count: int
+
+
+@dataclass
+class Dataset:
+    users: list[BenchUser]
+    boards: list[BenchBoard]
+    post_boards: list[int]  # 게시글 ID - 1 위치에 게시글이 속한 게시판 ID
+    seed: int
+    posts_by_board: dict[int, list[int]] = field(default_factory=dict)
+
+    def __post_init__(self):
+        for post_id, board_id in enumerate(self.post_boards, start=1):
+            self.posts_by_board.setdefault(board_id, []).append(post_id)
+
+    @property
+    def public_boards(self) -> list[BenchBoard]:
+        return [board for board in self.boards if board.public]
+
+    def owned_boards(self, user_id: int) -> list[BenchBoard]:
+        return [board for board in self.boards if board.user_id == user_id]
+
+    def iter_posts(self) -> Iterator[dict]:
+        """
+        게시글 row 생성 (메모리를 아끼기 위해 하나씩)
+        """
+        rng = random.Random(self.seed + 1)
+        for post_id, board_id in enumerate(self.post_boards, start=1):
+            board = self.boards[board_id - 1]
+            # private 게시판에는 게시판 주인만 글을 씀
+            user_id = (
+                board.user_id if not board.public else rng.randint(1, len(self.users))
+            )
+            created = BASE_DATE + timedelta(seconds=post_id)
+            yield {
+                "id": post_id,
+                "title": f"bench post {post_id}",
+                "content": " ".join(rng.choices(WORDS, k=rng.randint(10, 60))),
+                "create_date": created,
+                "update_date": created,
+                "user_id": user_id,
+                "board_id": board_id,
+            }
+
+
+def build_dataset(
+    users: int, boards: int, posts: int, private_ratio: float, skew: float, seed: int
+) -> Dataset:
+    """
+    데이터셋 정의 생성
+    - 게시판별 게시글 수는 Zipf 분포 (skew가 클수록 소수의 게시판에 게시글이 몰림)
+    """
+    rng = random.Random(seed)
+
+    bench_users = [
+        BenchUser(id=i, email=f"bench{i}@bench.com", full_name=f"bench{i}")
+        for i in range(1, users + 1)
+    ]
+
+    # 인기 순위를 섞어서 ID 순서와 게시글 수가 무관하도록
+    ranks = list(range(1, boards + 1))
+    rng.shuffle(ranks)
+    weights = [1 / rank**skew for rank in ranks]
+    post_boards = rng.choices(range(1, boards + 1), weights=weights, k=posts)
+
+    counts = [0] * boards
+    for board_id in post_boards:
+        counts[board_id - 1] += 1
+
+    bench_boards = [
+        BenchBoard(
+            id=i,
+            name=f"bench-{i}",
+            public=rng.random() >= private_ratio,
+            user_id=rng.randint(1, users),
+            count=counts[i - 1],
+        )
+        for i in range(1, boards + 1)
+    ]
+
+    return Dataset(
+        users=bench_users, boards=bench_boards, post_boards=post_boards, seed=seed
+    )
+
+
+def add_dataset_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    데이터셋 파라미터 (시딩과 벤치마크 실행 시 같은 값을 줘야 함)
+    """
+    group = parser.add_argument_group("dataset")
+    group.add_argument("--users", type=int, default=200, help="유저 수")
+    group.add_argument("--boards", type=int, default=100, help="게시판 수")
+    group.add_argument("--posts", type=int, default=50_000, help="게시글 수")
+    group.add_argument(
+        "--private-ratio", type=float, default=0.2, help="private 게시판 비율"
+    )
+    group.add_argument(
+        "--skew", type=float, default=1.1, help="게시판별 게시글 수 Zipf 지수"
+    )
+    group.add_argument("--seed", type=int, default=42, help="난수 seed")
+
+
+def dataset_from_args(args: argparse.Namespace) -> Dataset:
+    return build_dataset(
+        users=args.users,
+        boards=args.boards,
+        posts=args.posts,
+        private_ratio=args.private_ratio,
+        skew=args.skew,
+        seed=args.seed,
+    )
+
+
+def dataset_meta(args: argparse.Namespace) -> dict:
+    """
+    결과 파일에 남길 데이터셋 파라미터 (비교 시 같은 데이터셋인지 확인용)
+    """
+    return {
+        "users": args.users,
+        "boards": args.boards,
+        "posts": args.posts,
+        "private_ratio": args.private_ratio,
+        "skew": args.skew,
+        "seed": args.seed,
+    }
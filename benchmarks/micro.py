@@ -0,0 +1,193 @@
+"""
+마이크로 벤치마크
+- HTTP 없이 crud 함수 / 인증 dependency / 응답 직렬화를 직접 반복 호출해서 측정
+- .env 의 데이터베이스 / redis 를 사용 (benchmarks.seed 로 시딩한 데이터 기준)
+
+python -m benchmarks.micro --iterations 500 --output micro.json
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import timedelta
+
+from app.api.deps.extra_dep import to_list_item
+from app.api.deps.user_dep import get_current_user
+from app.core import security
+from app.core.db import SessionLocal, engine
+from app.core.session_cache import session_cache
+from app.crud import board_crud, post_crud
+from app.schemas.post_schema import POST_LIST_FIELDS, PostList
+from benchmarks.dataset import (
+    BASE_DATE,
+    WORDS,
+    Dataset,
+    add_dataset_arguments,
+    dataset_from_args,
+    dataset_meta,
+)
+from benchmarks.stats import Recorder, add_report_arguments, build_report, finish
+
+
+class Context:
+    """
+    벤치마크 함수들이 공유하는 상태
+    """
+
+    def __init__(self, db_session, dataset: Dataset, session_id: str):
+        self.db_session = db_session
+        self.dataset = dataset
+        self.session_id = session_id
+        self.rng = random.Random(dataset.seed)
+        # 게시글이 가장 많은 게시판 (목록 조회 최악의 경우)
+        self.largest_board = max(dataset.boards, key=lambda board: board.count)
+
+
+async def board_list_public(ctx: Context) -> None:
+    await board_crud.get_boards(db_session=ctx.db_session, user_id=None, limit=10)
+
+
+async def board_list_user(ctx: Context) -> None:
+    user = ctx.rng.choice(ctx.dataset.users)
+    await board_crud.get_boards(db_session=ctx.db_session, user_id=user.id, limit=10)
+
+
+async def post_list_first_page(ctx: Context) -> None:
+    await post_crud.get_posts_in_board(
+        db_session=ctx.db_session, board_id=ctx.largest_board.id, limit=20, cursor=None
+    )
+
+
+async def post_list_deep_page(ctx: Context) -> None:
+    # 가장 큰 게시판의 중간쯤 게시글을 cursor로
+    post_ids = ctx.dataset.posts_by_board[ctx.largest_board.id]
+    post_id = post_ids[len(post_ids) // 2]
+    await post_crud.get_posts_in_board(
+        db_session=ctx.db_session,
+        board_id=ctx.largest_board.id,
+        limit=20,
+        cursor=(BASE_DATE + timedelta(seconds=post_id), post_id),
+    )
+
+
+async def post_search(ctx: Context) -> None:
+    await post_crud.search_posts(
+        db_session=ctx.db_session,
+        query=ctx.rng.choice(WORDS),
+        user_id=None,
+        limit=10,
+    )
+
+
+async def serialize_post_page(ctx: Context) -> None:
+    posts = await post_crud.get_posts_in_board(
+        db_session=ctx.db_session, board_id=ctx.largest_board.id, limit=20, cursor=None
+    )
+    PostList(
+        board_id=ctx.largest_board.id,
+        limit=20,
+        post_list=[
+            to_list_item(post=post, fields=list(POST_LIST_FIELDS), excerpt=False)
+            for post in posts
+        ],
+        total=ctx.largest_board.count,
+        total_is_exact=True,
+    ).model_dump_json(exclude_unset=True)
+
+
+async def post_list_titles_only(ctx: Context) -> None:
+    # 본문 / 유저 정보 없이 제목 목록만 (fields=title)
+    posts = await post_crud.get_posts_in_board(
+        db_session=ctx.db_session,
+        board_id=ctx.largest_board.id,
+        limit=20,
+        cursor=None,
+        with_content=False,
+        with_user=False,
+    )
+    PostList(
+        board_id=ctx.largest_board.id,
+        limit=20,
+        post_list=[
+            to_list_item(post=post, fields=["title"], excerpt=False) for post in posts
+        ],
+        total=ctx.largest_board.count,
+        total_is_exact=True,
+    ).model_dump_json(exclude_unset=True)
+
+
+async def current_user_cold(ctx: Context) -> None:
+    # 세션 캐시 miss -> redis + db 조회
+    session_cache.clear()
+    await get_current_user(db_session=ctx.db_session, session_id=ctx.session_id)
+
+
+async def current_user_cached(ctx: Context) -> None:
+    await get_current_user(db_session=ctx.db_session, session_id=ctx.session_id)
+
+
+BENCHMARKS = {
+    "board_list_public": board_list_public,
+    "board_list_user": board_list_user,
+    "post_list_first_page": post_list_first_page,
+    "post_list_deep_page": post_list_deep_page,
+    "post_search": post_search,
+    "serialize_post_page": serialize_post_page,
+    "post_list_titles_only": post_list_titles_only,
+    "current_user_cold": current_user_cold,
+    "current_user_cached": current_user_cached,
+}
+
+
+async def run(args: argparse.Namespace) -> dict:
+    dataset = dataset_from_args(args)
+    names = args.only or list(BENCHMARKS)
+    recorder = Recorder()
+
+    session_id = await security.create_session(user_id=dataset.users[0].id)
+    try:
+        async with SessionLocal() as db_session:
+            ctx = Context(db_session, dataset, session_id)
+            for name in names:
+                benchmark = BENCHMARKS[name]
+                for i in range(args.warmup + args.iterations):
+                    started = time.perf_counter()
+                    await benchmark(ctx)
+                    took = time.perf_counter() - started
+                    # 매번 DB에서 다시 읽도록 identity map 비우기
+                    db_session.expunge_all()
+                    if i >= args.warmup:
+                        recorder.record(f"micro {name}", took, 200, True)
+    finally:
+        await security.delete_session(session_id=session_id)
+        await engine.dispose()
+
+    return build_report(
+        meta={
+            "kind": "micro",
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "dataset": dataset_meta(args),
+        },
+        # rps = 초당 연산 수 (벤치마크 함수 실행 시간 기준)
+        results={"micro": recorder.summary()},
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="마이크로 벤치마크")
+    parser.add_argument("--iterations", type=int, default=200, help="반복 횟수")
+    parser.add_argument("--warmup", type=int, default=20, help="warmup 반복 횟수")
+    parser.add_argument(
+        "--only", nargs="+", choices=list(BENCHMARKS), help="실행할 벤치마크"
+    )
+    add_dataset_arguments(parser)
+    add_report_arguments(parser)
+
+    args = parser.parse_args()
+    finish(asyncio.run(run(args)), args)
+
+
+if __name__ == "__main__":
+    main()
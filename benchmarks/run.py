@@ -0,0 +1,112 @@
+"""
+HTTP 부하 테스트 실행
+- 실행 중인 서버(python run.py 등)에 시나리오별로 동시 요청을 보내고 라우트별 지연 시간 / rps 측정
+- 서버는 benchmarks.seed 로 시딩한 DB를 사용해야 함 (같은 데이터셋 파라미터로 실행)
+
+python -m benchmarks.run --concurrency 20 --duration 30 --output baseline.json
+python -m benchmarks.run --baseline baseline.json --threshold 0.1
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+import httpx
+
+from benchmarks.dataset import add_dataset_arguments, dataset_from_args, dataset_meta
+from benchmarks.scenarios import SCENARIOS, Worker
+from benchmarks.stats import Recorder, add_report_arguments, build_report, finish
+
+
+async def run_worker(worker: Worker, scenario, deadline: float) -> None:
+    while time.perf_counter() < deadline:
+        try:
+            await scenario(worker)
+        except httpx.HTTPError as e:  # 연결 실패 / 타임아웃 등은 에러로만 기록
+            worker.recorder.record(f"{type(e).__name__}", 0.0, 0, False)
+
+
+async def run_scenario(name: str, args: argparse.Namespace, dataset) -> dict:
+    """
+    시나리오 하나 실행 (warmup 구간은 기록하지 않음)
+    """
+    scenario = SCENARIOS[name]
+    recorder = Recorder()
+
+    async def run_phase(duration: float, phase_recorder: Recorder) -> float:
+        deadline = time.perf_counter() + duration
+        # 가상 유저마다 별도 클라이언트 (쿠키 / keep-alive 커넥션 분리)
+        clients = [
+            httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout)
+            for _ in range(args.concurrency)
+        ]
+        workers = [
+            Worker(
+                client=client,
+                recorder=phase_recorder,
+                dataset=dataset,
+                rng=random.Random(f"{args.seed}-{name}-{i}"),
+                user=dataset.users[i % len(dataset.users)],
+            )
+            for i, client in enumerate(clients)
+        ]
+
+        started = time.perf_counter()
+        try:
+            await asyncio.gather(
+                *(run_worker(worker, scenario, deadline) for worker in workers)
+            )
+        finally:
+            for client in clients:
+                await client.aclose()
+        return time.perf_counter() - started
+
+    if args.warmup:
+        await run_phase(args.warmup, Recorder())
+    elapsed = await run_phase(args.duration, recorder)
+
+    return recorder.summary(elapsed)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    dataset = dataset_from_args(args)
+    names = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+
+    results = {}
+    for name in names:
+        print(f"running {name} ({args.concurrency} workers, {args.duration}s)...")
+        results[name] = await run_scenario(name, args, dataset)
+
+    return build_report(
+        meta={
+            "kind": "load",
+            "base_url": args.base_url,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "warmup": args.warmup,
+            "dataset": dataset_meta(args),
+        },
+        results=results,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTTP 부하 테스트")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument(
+        "--scenario", choices=["all", *SCENARIOS], default="all", help="실행할 시나리오"
+    )
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 가상 유저 수")
+    parser.add_argument("--duration", type=float, default=30, help="측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=5, help="warmup 시간 (초)")
+    parser.add_argument("--timeout", type=float, default=10, help="요청 타임아웃 (초)")
+    add_dataset_arguments(parser)
+    add_report_arguments(parser)
+
+    args = parser.parse_args()
+    finish(asyncio.run(run(args)), args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+부하 테스트 시나리오
+- 시나리오 함수 한 번 호출 = 가상 유저 한 명의 한 사이클
+- 모든 요청은 path 템플릿 단위로 기록 (ID가 달라도 같은 라우트로 집계)
+"""
+
+import random
+import time
+from dataclasses import dataclass
+
+import httpx
+
+from benchmarks.dataset import PASSWORD, WORDS, BenchUser, Dataset
+from benchmarks.stats import Recorder
+
+
+@dataclass
+class Worker:
+    """
+    가상 유저 (요청마다 같은 클라이언트 -> 커넥션 / 쿠키 재사용)
+    """
+
+    client: httpx.AsyncClient
+    recorder: Recorder
+    dataset: Dataset
+    rng: random.Random
+    user: BenchUser
+    logged_in: bool = False
+
+
+async def call(
+    worker: Worker,
+    method: str,
+    route: str,
+    expected: tuple[int, ...] = (200,),
+    **path_params,
+) -> httpx.Response:
+    """
+    요청 + 응답 시간 기록
+    - route : path 템플릿 (ex. "/boards/{board_id}")
+    - path_params 중 params / json / data 는 httpx로 그대로 전달
+    """
+    request_kwargs = {
+        key: path_params.pop(key)
+        for key in ("params", "json", "data")
+        if key in path_params
+    }
+    url = route.format(**path_params)
+
+    started = time.perf_counter()
+    response = await worker.client.request(method, url, **request_kwargs)
+    elapsed = time.perf_counter() - started
+
+    worker.recorder.record(
+        f"{method} {route}",
+        elapsed,
+        response.status_code,
+        response.status_code in expected,
+    )
+    return response
+
+
+async def login(worker: Worker) -> bool:
+    response = await call(
+        worker,
+        "POST",
+        "/login",
+        expected=(201,),
+        data={"username": worker.user.email, "password": PASSWORD},
+    )
+    worker.logged_in = response.status_code == 201
+    return worker.logged_in
+
+
+def pick_popular_board(worker: Worker):
+    """
+    게시글이 많은 게시판일수록 자주 조회 (public 게시판 중에서)
+    """
+    boards = worker.dataset.public_boards
+    return worker.rng.choices(boards, weights=[board.count + 1 for board in boards])[0]
+
+
+async def anonymous_browsing(worker: Worker) -> None:
+    """
+    비로그인 사용자 : 게시판 목록 -> 게시판 -> 게시글 목록 (2페이지) -> 게시글, 가끔 검색
+    """
+    rng = worker.rng
+    await call(
+        worker,
+        "GET",
+        "/boards",
+        expected=(200, 404),
+        params={"page": rng.randint(1, 3), "limit": 10},
+    )
+
+    board = pick_popular_board(worker)
+    await call(worker, "GET", "/boards/{board_id}", board_id=board.id)
+
+    response = await call(
+        worker,
+        "GET",
+        "/boards/{board_id}/posts",
+        expected=(200, 404),
+        board_id=board.id,
+        params={"limit": 20},
+    )
+    if response.status_code == 200 and response.json()["next_cursor"]:
+        await call(
+            worker,
+            "GET",
+            "/boards/{board_id}/posts",
+            expected=(200, 404),
+            board_id=board.id,
+            params={"limit": 20, "cursor": response.json()["next_cursor"]},
+        )
+
+    post_ids = worker.dataset.posts_by_board.get(board.id)
+    if post_ids:
+        await call(
+            worker,
+            "GET",
+            "/boards/{board_id}/posts/{post_id}",
+            board_id=board.id,
+            post_id=rng.choice(post_ids),
+        )
+
+    if rng.random() < 0.2:
+        await call(
+            worker,
+            "GET",
+            "/search/posts",
+            expected=(200, 404),
+            params={"q": rng.choice(WORDS), "limit": 10},
+        )
+
+
+async def logged_in_posting(worker: Worker) -> None:
+    """
+    로그인 사용자 : 게시판 목록 -> 게시글 작성 -> 목록 -> 수정 -> 삭제
+    - 작성한 게시글은 사이클 끝에 삭제 (반복 실행해도 데이터셋 분포 유지)
+    """
+    if not worker.logged_in and not await login(worker):
+        return
+
+    rng = worker.rng
+    await call(
+        worker, "GET", "/boards", expected=(200, 404), params={"page": 1, "limit": 10}
+    )
+
+    owned = worker.dataset.owned_boards(worker.user.id)
+    board = (
+        rng.choice(owned)
+        if owned and rng.random() < 0.3
+        else pick_popular_board(worker)
+    )
+
+    response = await call(
+        worker,
+        "POST",
+        "/boards/{board_id}/posts",
+        expected=(201,),
+        board_id=board.id,
+        json={
+            "title": f"bench by {worker.user.id}",
+            "content": " ".join(rng.choices(WORDS, k=30)),
+        },
+    )
+    if response.status_code != 201:
+        return
+    post_id = response.json()["id"]
+
+    await call(
+        worker,
+        "GET",
+        "/boards/{board_id}/posts",
+        board_id=board.id,
+        params={"limit": 20},
+    )
+    await call(
+        worker,
+        "PATCH",
+        "/boards/{board_id}/posts/{post_id}",
+        expected=(201,),
+        board_id=board.id,
+        post_id=post_id,
+        json={"content": " ".join(rng.choices(WORDS, k=30))},
+    )
+    await call(
+        worker,
+        "DELETE",
+        "/boards/{board_id}/posts/{post_id}",
+        board_id=board.id,
+        post_id=post_id,
+    )
+
+
+async def login_burst(worker: Worker) -> None:
+    """
+    로그인 폭주 : 로그인 -> 로그아웃 반복 (비밀번호 검증 비용 측정)
+    """
+    if await login(worker):
+        await call(worker, "POST", "/logout", expected=(201,))
+    worker.client.cookies.clear()
+    worker.logged_in = False
+
+
+SCENARIOS = {
+    "anonymous_browsing": anonymous_browsing,
+    "logged_in_posting": logged_in_posting,
+    "login_burst": login_burst,
+}
@@ -0,0 +1,119 @@
+"""
+벤치마크 데이터 시딩
+- .env 의 데이터베이스 / redis 를 사용 (로컬 벤치마크 전용 DB에서 실행할 것)
+
+python -m benchmarks.seed --reset [--users 200 --boards 100 --posts 50000 --seed 42]
+"""
+
+import argparse
+import asyncio
+import itertools
+import sys
+import time
+
+from sqlalchemy import func, insert, select, text
+
+from app.core import cache
+from app.core.db import SessionLocal, engine
+from app.core.security import pwd_context
+from app.models import User, Board, Post
+from benchmarks.dataset import (
+    BASE_DATE,
+    PASSWORD,
+    add_dataset_arguments,
+    dataset_from_args,
+)
+
+CHUNK_SIZE = 5000  # 한 번에 insert 하는 row 수
+
+
+def chunked(rows, size: int):
+    iterator = iter(rows)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+async def seed(args: argparse.Namespace) -> None:
+    dataset = dataset_from_args(args)
+
+    async with SessionLocal() as db_session:
+        existing = await db_session.scalar(select(func.count()).select_from(User))
+        if existing and not args.reset:
+            sys.exit(
+                "데이터가 이미 존재합니다. 모두 지우고 시딩하려면 --reset 옵션을 주세요."
+            )
+
+        if args.reset:
+            await db_session.execute(
+                text('TRUNCATE "user", board, post RESTART IDENTITY CASCADE')
+            )
+
+        started = time.perf_counter()
+        password = pwd_context.hash(PASSWORD)  # 모든 유저가 같은 해시 사용
+
+        await db_session.execute(
+            insert(User),
+            [
+                {
+                    "id": user.id,
+                    "email": user.email,
+                    "full_name": user.full_name,
+                    "join_date": BASE_DATE,
+                    "password": password,
+                }
+                for user in dataset.users
+            ],
+        )
+        await db_session.execute(
+            insert(Board),
+            [
+                {
+                    "id": board.id,
+                    "name": board.name,
+                    "public": board.public,
+                    "count": board.count,
+                    "create_date": BASE_DATE,
+                    "update_date": BASE_DATE,
+                    "user_id": board.user_id,
+                }
+                for board in dataset.boards
+            ],
+        )
+        for rows in chunked(dataset.iter_posts(), CHUNK_SIZE):
+            await db_session.execute(insert(Post), rows)
+
+        # ID를 직접 넣었으므로 시퀀스를 마지막 ID 뒤로 이동
+        for table in ("user", "board", "post"):
+            await db_session.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence('\"{table}\"', 'id'), "
+                    f'(SELECT coalesce(max(id), 1) FROM "{table}"))'
+                )
+            )
+
+        await db_session.commit()
+
+    async with engine.begin() as conn:  # 통계 갱신 (플래너가 시딩된 분포를 알도록)
+        await conn.execute(text("ANALYZE"))
+
+    await cache.bump_version(cache.BOARD_LIST_VERSION_KEY)  # 게시판 목록 캐시 무효화
+    await engine.dispose()
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"users={len(dataset.users)} boards={len(dataset.boards)} "
+        f"posts={len(dataset.post_boards)} ({elapsed:.1f}s)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="벤치마크 데이터 시딩")
+    add_dataset_arguments(parser)
+    parser.add_argument(
+        "--reset", action="store_true", help="기존 유저/게시판/게시글 모두 삭제 후 시딩"
+    )
+    asyncio.run(seed(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
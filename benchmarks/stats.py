@@ -0,0 +1,207 @@
+"""
+지연 시간 기록 / 집계 / 결과 파일 비교
+"""
+
+import argparse
+import json
+import math
+import platform
+import subprocess
+import sys
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+
+
+class Recorder:
+    """
+    라우트별 응답 시간 + 상태 코드 기록
+    - 라우트는 path 템플릿 단위 (ex. "GET /boards/{board_id}/posts")
+    """
+
+    def __init__(self):
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, Counter] = defaultdict(Counter)
+        self.errors: Counter = Counter()
+
+    def record(self, route: str, elapsed: float, status: int, ok: bool) -> None:
+        self.samples[route].append(elapsed)
+        self.statuses[route][status] += 1
+        if not ok:
+            self.errors[route] += 1
+
+    def summary(self, duration: float | None = None) -> dict:
+        """
+        라우트별 통계
+        - duration 이 없으면 (순차 실행) 라우트별 실행 시간 합으로 rps 계산
+        """
+        routes = {
+            route: summarize(
+                samples,
+                duration if duration is not None else sum(samples),
+                self.statuses[route],
+                self.errors[route],
+            )
+            for route, samples in sorted(self.samples.items())
+        }
+        total = sum(len(samples) for samples in self.samples.values())
+        if duration is None:
+            duration = sum(sum(samples) for samples in self.samples.values())
+        return {
+            "duration": round(duration, 3),
+            "requests": total,
+            "rps": round(total / duration, 2) if duration else 0.0,
+            "errors": sum(self.errors.values()),
+            "routes": routes,
+        }
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """
+    nearest-rank 방식 백분위수
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(p / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def summarize(
+    samples: list[float], duration: float, statuses: Counter, errors: int
+) -> dict:
+    values = sorted(samples)
+    return {
+        "count": len(values),
+        "errors": errors,
+        "rps": round(len(values) / duration, 2) if duration else 0.0,
+        "p50_ms": _ms(percentile(values, 50)),
+        "p95_ms": _ms(percentile(values, 95)),
+        "p99_ms": _ms(percentile(values, 99)),
+        "max_ms": _ms(values[-1]) if values else 0.0,
+        "status": {str(code): count for code, count in sorted(statuses.items())},
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(meta: dict, results: dict[str, dict]) -> dict:
+    """
+    결과 파일 형식
+    {"meta": {...}, "scenarios": {시나리오 이름: {"routes": {라우트: 통계}}}}
+    """
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            **meta,
+        },
+        "scenarios": results,
+    }
+
+
+def write_report(report: dict, path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+def print_report(report: dict) -> None:
+    for name, result in report["scenarios"].items():
+        print(
+            f"\n[{name}] {result['requests']} req / {result['duration']}s "
+            f"= {result['rps']} rps, errors {result['errors']}"
+        )
+        print(
+            f"{'route':<45}{'count':>8}{'rps':>10}"
+            f"{'p50':>10}{'p95':>10}{'p99':>10}{'err':>6}"
+        )
+        for route, stats in result["routes"].items():
+            print(
+                f"{route:<45}{stats['count']:>8}{stats['rps']:>10}"
+                f"{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['p99_ms']:>10}"
+                f"{stats['errors']:>6}"
+            )
+
+
+def compare_reports(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """
+    기준 결과 대비 성능 저하 목록
+    - 라우트별 p95 가 threshold 비율 이상 늘었거나 rps 가 threshold 비율 이상 줄면 저하로 판단
+    """
+    regressions = []
+
+    if baseline["meta"].get("dataset") != current["meta"].get("dataset"):
+        regressions.append("데이터셋 파라미터가 기준 결과와 다릅니다.")
+
+    for name, result in current["scenarios"].items():
+        base_result = baseline["scenarios"].get(name)
+        if not base_result:
+            continue
+
+        for route, stats in result["routes"].items():
+            base = base_result["routes"].get(route)
+            if not base or not base["count"]:
+                continue
+
+            if base["p95_ms"] and stats["p95_ms"] > base["p95_ms"] * (1 + threshold):
+                regressions.append(
+                    f"[{name}] {route} p95 {base['p95_ms']}ms -> {stats['p95_ms']}ms"
+                )
+            if stats["rps"] < base["rps"] * (1 - threshold):
+                regressions.append(
+                    f"[{name}] {route} rps {base['rps']} -> {stats['rps']}"
+                )
+            if stats["errors"] > base["errors"]:
+                regressions.append(
+                    f"[{name}] {route} errors {base['errors']} -> {stats['errors']}"
+                )
+
+    return regressions
+
+
+def add_report_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    결과 저장 / 기준 결과와 비교 옵션 (run.py, micro.py 공통)
+    """
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON 파일 경로")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="성능 저하로 판단하는 변화 비율 (기본 0.1 = 10%%)",
+    )
+
+
+def finish(report: dict, args: argparse.Namespace) -> None:
+    """
+    결과 출력 + 저장 + 기준 결과와 비교 (저하가 있으면 exit code 1)
+    """
+    print_report(report)
+    if args.output:
+        write_report(report, args.output)
+        print(f"\nsaved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_reports(baseline, report, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nno regression against {args.baseline}")
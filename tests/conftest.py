@@ -0,0 +1,112 @@
+"""
+API 테스트 공통 fixture
+
+- 실제 PostgreSQL / redis 가 필요 (TEST_DB_DATABASE 환경 변수로 테스트용 데이터베이스 지정)
+- 나머지 접속 정보(DB_USER, DB_HOST, REDIS_HOST ...)는 앱과 같은 환경 변수 / .env 사용
+- 테스트용 데이터베이스의 테이블은 테스트 시작 시 새로 만들고, 끝나면 삭제함
+
+TEST_DB_DATABASE=community_test pytest
+"""
+
+import os
+
+import pytest
+
+TEST_DB_DATABASE = os.environ.get("TEST_DB_DATABASE")
+
+if TEST_DB_DATABASE:
+    # 설정은 import 시점에 읽으므로 앱을 import 하기 전에 지정
+    os.environ["DB_DATABASE"] = TEST_DB_DATABASE
+    os.environ["DB_REPLICA_URLS"] = ""
+    os.environ["QUERY_DEBUG"] = "1"  # 요청별 쿼리 수 추적
+    os.environ["BOARD_COUNT_COALESCE"] = "0"
+    os.environ["METRICS_ENABLED"] = "0"
+
+
+@pytest.fixture(scope="session")
+def sync_engine():
+    if not TEST_DB_DATABASE:
+        pytest.skip("TEST_DB_DATABASE 환경 변수가 없어 API 테스트를 건너뜁니다.")
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.exc import OperationalError
+
+    from app.core.config import settings
+    from app.models import Base
+
+    engine = create_engine(settings.db_url_object("postgresql+psycopg2"))
+    try:
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+    except OperationalError as e:
+        pytest.skip(f"테스트용 데이터베이스에 연결할 수 없습니다 : {e}")
+
+    yield engine
+
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def client(sync_engine):
+    from fastapi.testclient import TestClient
+    from redis.exceptions import ConnectionError
+
+    from app.core.security import redis_client
+    from app.main import app
+
+    with TestClient(app) as client:
+        try:
+            client.portal.call(redis_client.ping)
+        except ConnectionError as e:
+            pytest.skip(f"redis에 연결할 수 없습니다 : {e}")
+        yield client
+
+
+@pytest.fixture
+def db(sync_engine):
+    """
+    테스트 데이터 생성용 (동기) 데이터베이스 세션
+    """
+    from sqlalchemy.orm import Session
+
+    with Session(sync_engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def board_with_posts(db):
+    """
+    유저 3명이 번갈아 가며 게시글 30개를 쓴 public 게시판
+    """
+    from app.models import User, Board, Post
+
+    users = [
+        User(email=f"author{i}-{os.urandom(4).hex()}@test.com", full_name=f"author{i}")
+        for i in range(3)
+    ]
+    for user in users:
+        user.password = "-"  # 로그인하지 않는 테스트용 유저
+    db.add_all(users)
+    db.flush()
+
+    board = Board(
+        name=f"board-{os.urandom(4).hex()}",
+        public=True,
+        count=30,
+        user_id=users[0].id,
+    )
+    db.add(board)
+    db.flush()
+
+    db.add_all(
+        Post(
+            title=f"post {i}",
+            content=f"content {i}",
+            user_id=users[i % len(users)].id,
+            board_id=board.id,
+        )
+        for i in range(30)
+    )
+    db.commit()
+    return board
@@ -0,0 +1,53 @@
+"""
+요청 method / 쿠키별 데이터베이스(primary, replica) 선택 테스트
+- 세션만 만들고 커넥션은 맺지 않으므로 데이터베이스 없이 실행됨
+"""
+
+import itertools
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette.requests import Request
+
+from app.api.deps import db_dep
+from app.core import db
+from app.core.db import PRIMARY_STICKY_COOKIE
+
+
+@pytest.fixture
+def replica_engine(monkeypatch):
+    url = "postgresql+asyncpg://replica/community"
+    replica_engine = create_async_engine(url, **db.engine_options(url))
+    monkeypatch.setattr(db, "replica_engines", [replica_engine])
+    monkeypatch.setattr(db, "_replica_cycle", itertools.cycle([replica_engine]))
+    return replica_engine
+
+
+def make_request(method: str, cookie: str | None = None) -> Request:
+    headers = [(b"cookie", cookie.encode())] if cookie else []
+    return Request({"type": "http", "method": method, "headers": headers})
+
+
+@pytest.mark.parametrize("method", ["GET", "HEAD"])
+def test_read_uses_replica(replica_engine, method):
+    session = db_dep.new_session(make_request(method))
+    assert session.bind is replica_engine
+
+
+@pytest.mark.parametrize("method", ["POST", "PATCH", "DELETE"])
+def test_write_uses_primary(replica_engine, method):
+    session = db_dep.new_session(make_request(method))
+    assert session.bind is db.engine
+
+
+def test_sticky_read_uses_primary(replica_engine):
+    # 최근에 쓰기 요청을 한 클라이언트는 방금 쓴 내용을 읽을 수 있도록 primary
+    session = db_dep.new_session(make_request("GET", f"{PRIMARY_STICKY_COOKIE}=1"))
+    assert session.bind is db.engine
+
+
+def test_pool_status_per_replica(replica_engine):
+    status = db.pool_status()
+    assert "wait_count" in status
+    assert len(status["replicas"]) == 1
+    assert status["replicas"][0]["size"] == replica_engine.pool.size()
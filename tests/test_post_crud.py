@@ -0,0 +1,38 @@
+"""
+게시글 생성/삭제 crud 테스트
+"""
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.core.db import SessionLocal
+from app.crud import board_crud, post_crud
+from app.models import Post
+from app.schemas.post_schema import PostCreate
+
+
+@pytest.mark.skipif(
+    settings.BOARD_COUNT_COALESCE, reason="coalesce 모드는 commit 후에 count 반영"
+)
+def test_create_post_on_deleted_board(client, db, board_with_posts):
+    # 게시판을 조회한 뒤, 게시글을 쓰기 전에 게시판이 삭제 표시된 경우
+    board_with_posts.deleted = True
+    db.commit()
+
+    async def create_post():
+        async with SessionLocal() as db_session:
+            await post_crud.create_post(
+                db_session=db_session,
+                post_create=PostCreate(title="title", content="content"),
+                user_id=board_with_posts.user_id,
+                board_id=board_with_posts.id,
+            )
+
+    with pytest.raises(board_crud.BoardNotFoundError):
+        client.portal.call(create_post)
+
+    count = db.scalar(
+        select(func.count()).select_from(Post).filter_by(board_id=board_with_posts.id)
+    )
+    assert count == 30  # 게시글이 추가되지 않음
@@ -0,0 +1,33 @@
+"""
+요청별 최대 쿼리 수 / 반복 쿼리(N+1) 추적 테스트
+"""
+
+import logging
+
+import pytest
+
+from app.core import query_budget
+
+
+def test_budget_exceeded_on_post_list(client, board_with_posts):
+    # 게시글 목록 조회는 쿼리 2개 (게시판 + 게시글) -> 최대 1개면 초과
+    with query_budget.budget("GET", "/boards/{board_id}/posts", 1):
+        with pytest.raises(query_budget.QueryBudgetExceeded, match="최대 1개"):
+            client.get(f"/boards/{board_with_posts.id}/posts")
+
+    # with 블록이 끝나면 최대 쿼리 수 해제
+    response = client.get(f"/boards/{board_with_posts.id}/posts")
+    assert response.status_code == 200
+
+
+def test_repeated_statement_warning(caplog):
+    statement = 'SELECT "user".id FROM "user" WHERE "user".id = $1::INTEGER'
+
+    with caplog.at_level(logging.WARNING, logger=query_budget.__name__):
+        with query_budget.track("GET", "/boards") as tracker:
+            for _ in range(3):
+                tracker.record(statement)
+
+    assert tracker.count == 3
+    assert "N+1 의심 : GET /boards" in caplog.text
+    assert "3번 실행" in caplog.text
@@ -0,0 +1,50 @@
+"""
+목록 조회 엔드포인트의 쿼리 수 테스트
+
+- 페이지 크기와 상관없이 쿼리 수가 일정해야 함 (게시판 / 게시글마다 유저를 따로 읽으면 N+1)
+"""
+
+import pytest
+
+from app.core import cache, query_budget
+
+# 엔드포인트별 최대 쿼리 수
+POST_LIST_QUERIES = 2  # 게시판 조회 + 게시글(유저 join) 조회
+BOARD_LIST_QUERIES = 3  # 게시판(유저 join) 조회 + public 게시판 수 (추정치 + 정확한 값)
+
+
+@pytest.mark.parametrize("limit", [1, 10, 30])
+def test_post_list_query_count(client, board_with_posts, limit):
+    with query_budget.budget("GET", "/boards/{board_id}/posts", POST_LIST_QUERIES):
+        response = client.get(f"/boards/{board_with_posts.id}/posts?limit={limit}")
+
+    assert response.status_code == 200
+    post_list = response.json()["post_list"]
+    assert len(post_list) == limit
+    assert all(post["user_info"]["full_name"] for post in post_list)
+
+
+@pytest.mark.parametrize("limit", [1, 10, 30])
+def test_board_list_query_count(client, board_with_posts, limit):
+    # 캐시된 목록이 아니라 DB에서 읽도록 게시판 목록 캐시 무효화
+    client.portal.call(cache.bump_version, cache.BOARD_LIST_VERSION_KEY)
+
+    with query_budget.budget("GET", "/boards", BOARD_LIST_QUERIES):
+        response = client.get(f"/boards?limit={limit}")
+
+    assert response.status_code == 200
+    board_list = response.json()["board_list"]
+    assert 1 <= len(board_list) <= limit
+    assert all(board["user_info"]["full_name"] for board in board_list)
+
+
+def test_board_list_total_cached_across_pages(client, board_with_posts):
+    client.portal.call(cache.bump_version, cache.BOARD_LIST_VERSION_KEY)
+    first = client.get("/boards?limit=1").json()
+
+    # 다른 페이지 / limit 목록은 캐시된 전체 게시판 수를 사용 -> 게시판 조회 쿼리만
+    with query_budget.budget("GET", "/boards", 1):
+        response = client.get("/boards?limit=2")
+
+    assert response.status_code == 200
+    assert response.json()["total"] == first["total"]